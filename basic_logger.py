@@ -3,11 +3,27 @@ import os
 import sys
 import time
 import json
+import atexit
+import queue
 import traceback
 from datetime import datetime
 import io
 import threading
 
+try:
+    import orjson
+
+    def _dumps(obj):
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS,
+                            default=str).decode()
+except ImportError:
+    def _dumps(obj):
+        return json.dumps(obj, indent=2, default=str)
+
+# Cap on formatted context size; larger payloads get truncated rather than
+# blowing up a single log line
+_MAX_CONTEXT_CHARS = 64 * 1024
+
 # Use project logs folder
 LOG_DIR = '/Users/claytonbadland/flask_project/logs'
 timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
@@ -22,8 +38,12 @@ if not os.path.exists(LOG_DIR):
 ORIGINAL_STDOUT = sys.stdout
 ORIGINAL_STDERR = sys.stderr
 
-# Lock for thread-safe writing
-LOG_LOCK = threading.Lock()
+# Log records are pushed onto this queue by any thread and drained into the
+# files by a single background thread, so writers never contend on a lock
+_LOG_Q = queue.SimpleQueue()
+
+# How many queued records the flusher thread folds into one write
+_FLUSH_BATCH_SIZE = 512
 
 # Global settings - these can be set before calling initialize()
 PRODUCTION_MODE = False
@@ -31,9 +51,118 @@ CAPTURE_STDOUT = True
 LOG_LEVEL = "DEBUG"  # Default to debug level in development
 ALWAYS_LOG_DEBUG_TO_FILE = True  # Always log debug to debug log file, even in production
 
+# Numeric level hierarchy; the integer threshold is kept in sync with
+# LOG_LEVEL so level checks are a single comparison
+_LEVEL_NUM = {
+    "DEBUG": 0,
+    "INFO": 1,
+    "WARNING": 2,
+    "ERROR": 3
+}
+_CURRENT_LEVEL_INT = _LEVEL_NUM[LOG_LEVEL]
+
 # Flag to track if logger is initialized
 _LOGGER_INITIALIZED = False
 
+# Persistent file handles - opened once in initialize() and kept open so each
+# log line is a single buffered write instead of open/write/flush/fsync/close
+_LOG_FH = None
+_DEBUG_FH = None
+
+# Only force data to disk for ERROR messages; normal lines rely on buffering
+FSYNC_ON_ERROR = True
+
+# Cache for the seconds portion of the timestamp so strftime runs once per
+# second instead of once per log line
+_LAST_TS_SEC = 0
+_LAST_TS_STR = ""
+
+def _fast_ts():
+    """Return an ISO 8601 timestamp, reusing the cached seconds prefix."""
+    global _LAST_TS_SEC, _LAST_TS_STR
+    t = time.time()
+    s = int(t)
+    if s != _LAST_TS_SEC:
+        _LAST_TS_SEC = s
+        _LAST_TS_STR = time.strftime("%Y-%m-%dT%H:%M:%S", time.localtime(s))
+    return f"{_LAST_TS_STR}.{int((t - s) * 1e6):06d}"
+
+def _enqueue(text, to_main=True, to_debug=False, fsync=False):
+    """Hand a formatted record to the background flusher thread."""
+    _LOG_Q.put((to_main, to_debug, text, fsync))
+
+def _write_batch(batch):
+    """Write one batch of queued records to the log files."""
+    main_parts = []
+    debug_parts = []
+    want_fsync = False
+    for to_main, to_debug, text, fsync in batch:
+        if to_main:
+            main_parts.append(text)
+        if to_debug:
+            debug_parts.append(text)
+        want_fsync = want_fsync or fsync
+
+    try:
+        if main_parts and _LOG_FH:
+            _LOG_FH.write("".join(main_parts))
+            _LOG_FH.flush()
+            if want_fsync:
+                os.fsync(_LOG_FH.fileno())
+        if debug_parts and _DEBUG_FH:
+            _DEBUG_FH.write("".join(debug_parts))
+            _DEBUG_FH.flush()
+    except Exception as e:
+        # Don't use logging here to avoid recursion
+        print(f"ERROR writing to log: {e}")
+
+_FLUSHER_STARTED = False
+
+def _start_flusher():
+    """Start the queue-draining thread once per process.
+
+    Runs even when the log handles failed to open (_write_batch tolerates
+    None handles), so producers can never grow _LOG_Q without bound."""
+    global _FLUSHER_STARTED
+    if not _FLUSHER_STARTED:
+        _FLUSHER_STARTED = True
+        threading.Thread(target=_drain_log_queue, daemon=True,
+                         name="basic_logger_flusher").start()
+
+def _drain_log_queue():
+    """Background thread: drain queued records into the files in batches."""
+    while True:
+        batch = [_LOG_Q.get()]
+        while len(batch) < _FLUSH_BATCH_SIZE:
+            try:
+                batch.append(_LOG_Q.get_nowait())
+            except queue.Empty:
+                break
+        _write_batch(batch)
+
+def _close_log_handles():
+    """Flush pending records and close the log handles (registered with atexit)."""
+    global _LOG_FH, _DEBUG_FH
+
+    # Drain whatever the flusher thread hasn't picked up yet
+    pending = []
+    while True:
+        try:
+            pending.append(_LOG_Q.get_nowait())
+        except queue.Empty:
+            break
+    if pending:
+        _write_batch(pending)
+
+    for fh in (_LOG_FH, _DEBUG_FH):
+        if fh:
+            try:
+                fh.close()
+            except Exception:
+                pass
+    _LOG_FH = None
+    _DEBUG_FH = None
+
 class LoggingStream(io.TextIOBase):
     """A stream that writes to both the original stream and the log file."""
     
@@ -42,128 +171,107 @@ class LoggingStream(io.TextIOBase):
         self.stream_name = stream_name
     
     def write(self, text):
-        if text and text.strip():  # Only log non-empty content
+        if not text:
+            return 0
+        if text.strip():  # Only log non-empty content
             # Write to original stream
             self.original_stream.write(text)
             
             # Write to log file if stdout capture is enabled
             if CAPTURE_STDOUT and _LOGGER_INITIALIZED:
-                with LOG_LOCK:
-                    try:
-                        with open(LOG_FILE, "a", encoding="utf-8") as f:
-                            timestamp = datetime.now().isoformat()
-                            f.write(f"{timestamp} [TERMINAL:{self.stream_name}] {text.rstrip()}\n")
-                            f.flush()
-                            os.fsync(f.fileno())
-                        
-                        # Also write terminal output to debug log if enabled
-                        if ALWAYS_LOG_DEBUG_TO_FILE:
-                            with open(DEBUG_LOG_FILE, "a", encoding="utf-8") as f:
-                                timestamp = datetime.now().isoformat()
-                                f.write(f"{timestamp} [TERMINAL:{self.stream_name}] {text.rstrip()}\n")
-                                f.flush()
-                                os.fsync(f.fileno())
-                    except Exception as e:
-                        # Don't use logging here to avoid recursion
-                        print(f"Error writing terminal output to log: {e}")
+                timestamp = _fast_ts()
+                line = f"{timestamp} [TERMINAL:{self.stream_name}] {text.rstrip()}\n"
+                _enqueue(line, to_debug=ALWAYS_LOG_DEBUG_TO_FILE)
         
         return len(text) if text else 0
     
     def flush(self):
         self.original_stream.flush()
+        if _LOG_FH:
+            try:
+                _LOG_FH.flush()
+            except Exception:
+                pass
 
 def format_context(context):
-    """Format context data for better readability in logs."""
+    """Format context data for better readability in logs.
+
+    Must never raise into the caller: a broken __str__ on a context value
+    degrades the output, not the operation being logged.
+    """
     if not context:
         return ""
-        
-    if isinstance(context, dict):
-        try:
+
+    try:
+        if isinstance(context, dict):
             # For small dicts, format inline
             if len(context) <= 3 and all(len(str(v)) < 50 for v in context.values()):
                 return " - " + ", ".join(f"{k}={v}" for k, v in context.items())
-            # For larger or complex dicts, format with indentation
-            else:
-                formatted = json.dumps(context, indent=4, default=str)
-                # Add indentation to each line for better readability
-                return "\n    " + "\n    ".join(formatted.split("\n"))
-        except:
-            # Fallback if JSON serialization fails
+            # For larger or complex dicts, format with indentation. The dumper
+            # stringifies unknown types via default=str, so only a genuinely
+            # unserializable structure (e.g. circular refs) raises.
+            try:
+                formatted = _dumps(context)
+            except (TypeError, ValueError):
+                return " - " + str(context)
+            if len(formatted) > _MAX_CONTEXT_CHARS:
+                formatted = formatted[:_MAX_CONTEXT_CHARS] + "... [truncated]"
+            # Add indentation to each line for better readability
+            return "\n    " + "\n    ".join(formatted.split("\n"))
+        elif isinstance(context, (list, tuple)):
+            try:
+                formatted = _dumps(context)
+            except (TypeError, ValueError):
+                return " - " + str(context)
+            if len(formatted) > _MAX_CONTEXT_CHARS:
+                formatted = formatted[:_MAX_CONTEXT_CHARS] + "... [truncated]"
+            return "\n    " + "\n    ".join(formatted.split("\n"))
+        else:
             return " - " + str(context)
-    elif isinstance(context, (list, tuple)):
+    except Exception:
+        # Last resort: even str(context) can raise
         try:
-            formatted = json.dumps(context, indent=4, default=str)
-            return "\n    " + "\n    ".join(formatted.split("\n"))
-        except:
             return " - " + str(context)
-    else:
-        return " - " + str(context)
+        except Exception:
+            return " - <unprintable context>"
 
 def write_log(level, message, context=None):
     """Write a log message directly to the file."""
     if not _LOGGER_INITIALIZED:
         initialize()
         
-    # Format the message with context
-    timestamp = datetime.now().isoformat()
-    formatted_context = format_context(context)
-    if formatted_context and not formatted_context.startswith("\n"):
-        log_message = f"{timestamp} [{level}] {message}{formatted_context}\n"
-    elif formatted_context:
-        log_message = f"{timestamp} [{level}] {message}{formatted_context}\n"
-    else:
-        log_message = f"{timestamp} [{level}] {message}\n"
-    
-    with LOG_LOCK:
-        try:
-            # Always write DEBUG messages to debug log file if enabled
-            if level == "DEBUG" and ALWAYS_LOG_DEBUG_TO_FILE:
-                with open(DEBUG_LOG_FILE, "a", encoding="utf-8") as f:
-                    f.write(log_message)
-                    f.flush()
-                    os.fsync(f.fileno())
-            
-            # Skip logging to main log if the level is below the current log level
-            if not should_log(level):
-                # Still print to console if appropriate
-                if should_log_to_console(level):
-                    console_msg = message
-                    if context and isinstance(context, dict) and len(context) <= 2:
-                        # Show context in console for small dicts
-                        console_msg += format_context(context)
-                    print(f"{level}: {console_msg}")
-                return
-            
-            # Write to main log file
-            with open(LOG_FILE, "a", encoding="utf-8") as f:
-                f.write(log_message)
-                f.flush()
-                os.fsync(f.fileno())
-            
-            # Print to console with truncation for very long messages
-            if should_log_to_console(level):
-                console_msg = message
-                if context and isinstance(context, dict) and len(context) <= 2:
-                    # Show context in console for small dicts
-                    console_msg += format_context(context)
-                print(f"{level}: {console_msg}")
-        except Exception as e:
-            print(f"ERROR writing to log: {e}")
+    # Decide where the record goes before paying for any formatting
+    to_debug = level == "DEBUG" and ALWAYS_LOG_DEBUG_TO_FILE
+    to_main = _LEVEL_NUM.get(level, 0) >= _CURRENT_LEVEL_INT
+    to_console = to_main
+    if not (to_main or to_debug or to_console):
+        return
+
+    if to_main or to_debug:
+        # Format the message with context
+        timestamp = _fast_ts()
+        formatted_context = format_context(context)
+        if formatted_context:
+            log_message = f"{timestamp} [{level}] {message}{formatted_context}\n"
+        else:
+            log_message = f"{timestamp} [{level}] {message}\n"
+
+        # Only force to disk for errors; everything else relies on buffering
+        fsync = level == "ERROR" and FSYNC_ON_ERROR
+        _enqueue(log_message, to_main=to_main, to_debug=to_debug, fsync=fsync)
+
+    # Print to console with truncation for very long messages
+    if to_console:
+        console_msg = message
+        if context and isinstance(context, dict) and len(context) <= 2:
+            # Show context in console for small dicts
+            console_msg += format_context(context)
+        print(f"{level}: {console_msg}")
 
 def should_log(level):
     """Determine if a message at the given level should be logged based on the current log level."""
-    level_hierarchy = {
-        "DEBUG": 0,
-        "INFO": 1,
-        "WARNING": 2,
-        "ERROR": 3
-    }
-    
     # Default to showing everything if level not recognized
-    current_level = level_hierarchy.get(LOG_LEVEL, 0)
-    message_level = level_hierarchy.get(level, 0)
-    
-    return message_level >= current_level
+    return _LEVEL_NUM.get(level, 0) >= _CURRENT_LEVEL_INT
 
 def should_log_to_console(level):
     """Determine if a message should be shown in the console."""
@@ -172,74 +280,84 @@ def should_log_to_console(level):
 
 def initialize():
     """Create the log file with header info."""
-    global _LOGGER_INITIALIZED
-    
+    global _LOGGER_INITIALIZED, _LOG_FH, _DEBUG_FH
+
     if _LOGGER_INITIALIZED:
         return True
-        
+
+    # A consumer for the record queue must exist no matter what happens
+    # below; producers keep enqueueing even when initialization fails
+    _start_flusher()
+
+    # Open the persistent handles first: the headers below are cosmetic,
+    # but without handles every subsequent record is lost
+    try:
+        if _LOG_FH is None:
+            _LOG_FH = open(LOG_FILE, "w", buffering=1 << 16, encoding="utf-8")
+        if ALWAYS_LOG_DEBUG_TO_FILE and _DEBUG_FH is None:
+            _DEBUG_FH = open(DEBUG_LOG_FILE, "w", buffering=1 << 16, encoding="utf-8")
+        atexit.register(_close_log_handles)
+    except Exception as e:
+        print(f"ERROR opening log files: {e}")
+        return False
+
     try:
         print(f"*** LOGGING TO: {LOG_FILE} ***")
         if ALWAYS_LOG_DEBUG_TO_FILE:
             print(f"*** DEBUG LOGGING TO: {DEBUG_LOG_FILE} ***")
-        
-        # Initialize main log file
-        with open(LOG_FILE, "w", encoding="utf-8") as f:
-            f.write(f"=== LOG STARTED AT {datetime.now().isoformat()} ===\n")
-            f.write(f"=== PID: {os.getpid()} ===\n")
-            f.write(f"=== USER: {os.getlogin()} ===\n")
-            f.write(f"=== CWD: {os.getcwd()} ===\n")
-            f.write(f"=== PYTHON: {sys.version} ===\n")
-            f.write(f"=== PRODUCTION MODE: {PRODUCTION_MODE} ===\n")
-            f.write(f"=== LOG LEVEL: {LOG_LEVEL} ===\n")
-            f.write(f"=== TERMINAL CAPTURE: {CAPTURE_STDOUT} ===\n")
-            f.write(f"=== SEPARATE DEBUG LOG: {ALWAYS_LOG_DEBUG_TO_FILE} ===\n")
-            
-            # Include more system information
-            try:
-                import platform
-                f.write(f"=== PLATFORM: {platform.platform()} ===\n")
-                f.write(f"=== SYSTEM: {platform.system()} {platform.release()} ===\n")
-            except ImportError:
-                pass
-                
-            f.write("\n")
-            f.flush()
-            os.fsync(f.fileno())
-            
-        # Initialize debug log file if enabled
-        if ALWAYS_LOG_DEBUG_TO_FILE:
-            with open(DEBUG_LOG_FILE, "w", encoding="utf-8") as f:
-                f.write(f"=== DEBUG LOG STARTED AT {datetime.now().isoformat()} ===\n")
-                f.write(f"=== PID: {os.getpid()} ===\n")
-                f.write(f"=== USER: {os.getlogin()} ===\n")
-                f.write(f"=== CWD: {os.getcwd()} ===\n")
-                f.write(f"=== PYTHON: {sys.version} ===\n")
-                f.write(f"=== PRODUCTION MODE: {PRODUCTION_MODE} ===\n")
-                f.write(f"=== LOG LEVEL: {LOG_LEVEL} ===\n")
-                f.write(f"=== TERMINAL CAPTURE: {CAPTURE_STDOUT} ===\n")
-                
-                # Include more system information
-                try:
-                    import platform
-                    f.write(f"=== PLATFORM: {platform.platform()} ===\n")
-                    f.write(f"=== SYSTEM: {platform.system()} {platform.release()} ===\n")
-                except ImportError:
-                    pass
-                    
-                f.write("\n")
-                f.flush()
-                os.fsync(f.fileno())
-        
-        _LOGGER_INITIALIZED = True
-        
-        # Setup stdout capture based on production mode
-        if CAPTURE_STDOUT:
-            enable_stdout_capture(True)
-            
-        return True
+
+        # os.getlogin() needs a controlling terminal and raises OSError
+        # under systemd/gunicorn/cron; fall back to the environment
+        try:
+            user = os.getlogin()
+        except OSError:
+            user = os.environ.get("USER", "unknown")
+
+        # Gather the system information once and share it between both headers
+        started_at = datetime.now().isoformat()
+        sys_info = [
+            f"=== PID: {os.getpid()} ===\n",
+            f"=== USER: {user} ===\n",
+            f"=== CWD: {os.getcwd()} ===\n",
+            f"=== PYTHON: {sys.version} ===\n",
+            f"=== PRODUCTION MODE: {PRODUCTION_MODE} ===\n",
+            f"=== LOG LEVEL: {LOG_LEVEL} ===\n",
+            f"=== TERMINAL CAPTURE: {CAPTURE_STDOUT} ===\n",
+        ]
+
+        # Include more system information
+        try:
+            import platform
+            sys_info.append(f"=== PLATFORM: {platform.platform()} ===\n")
+            sys_info.append(f"=== SYSTEM: {platform.system()} {platform.release()} ===\n")
+        except ImportError:
+            pass
+
+        shared_info = "".join(sys_info)
+
+        # Write the headers through the persistent handles
+        _LOG_FH.write(f"=== LOG STARTED AT {started_at} ===\n"
+                      + shared_info
+                      + f"=== SEPARATE DEBUG LOG: {ALWAYS_LOG_DEBUG_TO_FILE} ===\n\n")
+        _LOG_FH.flush()
+        os.fsync(_LOG_FH.fileno())
+
+        if _DEBUG_FH is not None:
+            _DEBUG_FH.write(f"=== DEBUG LOG STARTED AT {started_at} ===\n"
+                            + shared_info + "\n")
+            _DEBUG_FH.flush()
+            os.fsync(_DEBUG_FH.fileno())
     except Exception as e:
-        print(f"ERROR initializing log: {e}")
-        return False
+        # Header failure is cosmetic; logging itself stays up
+        print(f"ERROR writing log header: {e}")
+
+    _LOGGER_INITIALIZED = True
+
+    # Setup stdout capture based on production mode
+    if CAPTURE_STDOUT:
+        enable_stdout_capture(True)
+
+    return True
 
 def info(message, context=None):
     """Log info message with optional context data."""
@@ -269,33 +387,14 @@ def log_terminal_output(output_text, source="command"):
     if not _LOGGER_INITIALIZED:
         return
         
-    timestamp = datetime.now().isoformat()
-    
-    with LOG_LOCK:
-        try:
-            # Always write to debug log if enabled
-            if ALWAYS_LOG_DEBUG_TO_FILE:
-                with open(DEBUG_LOG_FILE, "a", encoding="utf-8") as f:
-                    # Split by lines to ensure proper formatting
-                    for line in output_text.splitlines():
-                        if line.strip():  # Skip empty lines
-                            f.write(f"{timestamp} [TERMINAL:{source}] {line}\n")
-                    f.flush()
-                    os.fsync(f.fileno())
-            
-            # Skip main log if terminal capture is disabled
-            if not CAPTURE_STDOUT:
-                return
-                
-            with open(LOG_FILE, "a", encoding="utf-8") as f:
-                # Split by lines to ensure proper formatting
-                for line in output_text.splitlines():
-                    if line.strip():  # Skip empty lines
-                        f.write(f"{timestamp} [TERMINAL:{source}] {line}\n")
-                f.flush()
-                os.fsync(f.fileno())
-        except Exception as e:
-            print(f"ERROR writing terminal output to log: {e}")
+    timestamp = _fast_ts()
+
+    # Build the whole payload up front so each log gets a single write,
+    # skipping empty lines
+    payload = "".join(f"{timestamp} [TERMINAL:{source}] {line}\n"
+                      for line in output_text.splitlines() if line.strip())
+    if payload:
+        _enqueue(payload, to_main=CAPTURE_STDOUT, to_debug=ALWAYS_LOG_DEBUG_TO_FILE)
 
 def capture_command_output(command):
     """Execute a command and capture its output to the log."""
@@ -304,29 +403,43 @@ def capture_command_output(command):
     info(f"Executing command: {command}")
     
     try:
-        # Run the command and capture output
+        # Run the command with line-buffered pipes so output can be logged
+        # as it arrives instead of buffering everything until exit
         process = subprocess.Popen(
             command,
             shell=True,
             stdout=subprocess.PIPE,
             stderr=subprocess.PIPE,
-            text=True
+            text=True,
+            bufsize=1
         )
-        
-        stdout, stderr = process.communicate()
-        exit_code = process.returncode
-        
-        # Log standard output
-        if stdout:
-            log_terminal_output(stdout, "stdout")
-        
-        # Log standard error
-        if stderr:
-            log_terminal_output(stderr, "stderr")
-        
+
+        captured = {"stdout": [], "stderr": []}
+
+        def drain(pipe, source):
+            for line in iter(pipe.readline, ''):
+                captured[source].append(line)
+                if line.strip() and _LOGGER_INITIALIZED:
+                    _enqueue(f"{_fast_ts()} [TERMINAL:{source}] {line.rstrip()}\n",
+                             to_main=CAPTURE_STDOUT, to_debug=ALWAYS_LOG_DEBUG_TO_FILE)
+            pipe.close()
+
+        readers = [
+            threading.Thread(target=drain, args=(process.stdout, "stdout")),
+            threading.Thread(target=drain, args=(process.stderr, "stderr"))
+        ]
+        for reader in readers:
+            reader.start()
+        for reader in readers:
+            reader.join()
+
+        exit_code = process.wait()
+        stdout = "".join(captured["stdout"])
+        stderr = "".join(captured["stderr"])
+
         info(f"Command completed with exit code: {exit_code}")
         return stdout, stderr, exit_code
-    
+
     except Exception as e:
         error(f"Error executing command: {command}", e)
         return "", str(e), -1
@@ -351,13 +464,14 @@ def enable_stdout_capture(enabled=True):
 
 def set_production_mode(enabled=True):
     """Configure the logger for production mode with reduced verbosity."""
-    global PRODUCTION_MODE, LOG_LEVEL, CAPTURE_STDOUT
-    
+    global PRODUCTION_MODE, LOG_LEVEL, CAPTURE_STDOUT, _CURRENT_LEVEL_INT
+
     PRODUCTION_MODE = enabled
-    
+
     if enabled:
         # In production mode, set higher log level and disable terminal output capture
         LOG_LEVEL = "INFO"  # Only log INFO and above in production
+        _CURRENT_LEVEL_INT = _LEVEL_NUM[LOG_LEVEL]
         CAPTURE_STDOUT = False  # Disable terminal output capture
         
         # Ensure stdout is restored
@@ -372,6 +486,7 @@ def set_production_mode(enabled=True):
     else:
         # In development mode, enable all logging
         LOG_LEVEL = "DEBUG"
+        _CURRENT_LEVEL_INT = _LEVEL_NUM[LOG_LEVEL]
         CAPTURE_STDOUT = True
         
         # Enable terminal capture
@@ -383,11 +498,11 @@ def set_production_mode(enabled=True):
 
 def set_log_level(level):
     """Set the minimum log level (DEBUG, INFO, WARNING, ERROR)."""
-    global LOG_LEVEL
-    
-    valid_levels = ["DEBUG", "INFO", "WARNING", "ERROR"]
-    if level.upper() in valid_levels:
+    global LOG_LEVEL, _CURRENT_LEVEL_INT
+
+    if level.upper() in _LEVEL_NUM:
         LOG_LEVEL = level.upper()
+        _CURRENT_LEVEL_INT = _LEVEL_NUM[LOG_LEVEL]
         if _LOGGER_INITIALIZED:
             info(f"Log level set to {LOG_LEVEL}")
     else:
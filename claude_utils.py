@@ -1,37 +1,55 @@
 import os
 import json
+import math
+import hashlib
+import functools
 from pathlib import Path
 from typing import Any, Dict, Union  # Add Union to imports
 from dotenv import load_dotenv
+import httpx
 from anthropic import Anthropic
 import ast
 import re
 import time
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 from firebase_utils import upload_file
 from template_formatter import format_name
-import requests
 import logging  # Add logging import for error messages
 
 # Environment and constants
 PROJECT_ROOT = Path(__file__).parent
 env_path = PROJECT_ROOT / 'config.env'
-load_dotenv(env_path)
 
-# Ensure required paths exist
+# Skip re-reading the dotenv file when the key is already in the environment
+if 'CLAUDE_API_KEY' not in os.environ:
+    load_dotenv(env_path)
+
+# Ensure required paths exist (only hit the filesystem when missing)
 PATHS = {
     'PARSED_JSON': PROJECT_ROOT / 'parsed_jsons',
     'OUTPUT': PROJECT_ROOT / 'outputs'
 }
 for path in PATHS.values():
-    path.mkdir(parents=True, exist_ok=True)
+    if not path.is_dir():
+        path.mkdir(parents=True, exist_ok=True)
 
 # Get the API key; abort if not set
 CLAUDE_API_KEY = os.getenv('CLAUDE_API_KEY')
 if not CLAUDE_API_KEY:
     raise ValueError("CLAUDE_API_KEY not found in environment variables.")
 
-# Initialize Anthropic client
-client = Anthropic(api_key=CLAUDE_API_KEY)
+# Initialize Anthropic client with an explicitly pooled HTTP client so TLS
+# handshakes are amortized across blurb generations and requests can't hang
+# past the configured timeout
+_http_client = httpx.Client(
+    limits=httpx.Limits(max_keepalive_connections=16, max_connections=32),
+    timeout=httpx.Timeout(30.0, connect=3.0)
+)
+client = Anthropic(api_key=CLAUDE_API_KEY, http_client=_http_client)
 
 def transform_rchilli_to_enriched(data: Any) -> Any:
     """Transform data from rChilli format to the enriched format expected downstream."""
@@ -53,35 +71,52 @@ def process_claude_response(response: Any) -> str:
 
 def populate_name(resume_data: dict) -> dict:
     """Populate the full name in the resume data by combining first and last names."""
-    try:
-        basics = resume_data.get("data", {}).get("profile", {}).get("basics", {})
-        first = basics.get("FirstName") or basics.get("first_name", "")
-        last = basics.get("LastName") or basics.get("last_name", "")
-        full_name = f"{first} {last}".strip()
-        resume_data["data"]["profile"]["basics"]["FormattedName"] = full_name
-        return resume_data
-    except Exception as e:
-        print(f"Error populating name: {e}")
-        return resume_data
+    # Build the nested structure once so the write below can't fail
+    basics = resume_data.setdefault("data", {}).setdefault("profile", {}).setdefault("basics", {})
+    first = basics.get("FirstName") or basics.get("first_name", "")
+    last = basics.get("LastName") or basics.get("last_name", "")
+    basics["FormattedName"] = " ".join(filter(None, (first, last)))
+    return resume_data
 
-def load_company_status(file_path: str) -> dict:
-    """Load a JSON file and attempt to fix formatting issues if necessary."""
+@functools.lru_cache(maxsize=64)
+def _load_status_cached(file_path: str, mtime_ns: int, size: int) -> dict:
+    """Parse a company status file, attempting repairs if necessary.
+
+    mtime_ns and size are part of the cache key so edits to the file
+    invalidate the cached result.
+    """
+    with open(file_path, 'r', encoding='utf-8') as f:
+        content = f.read()
     try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            content = f.read()
+        if orjson is not None:
+            return orjson.loads(content)
         return json.loads(content)
-    except json.JSONDecodeError:
+    except (json.JSONDecodeError, ValueError):
         try:
             fixed_dict = ast.literal_eval(content)
             return json.loads(json.dumps(fixed_dict))
         except Exception:
             try:
-                fixed_content = re.sub(r"(?<!\\)'", r"\"", content)
+                # Swap unescaped single quotes for double quotes: protect
+                # escaped ones, replace, then restore - three C-level scans
+                # instead of a lookbehind regex
+                fixed_content = (content.replace("\\'", "\x00")
+                                        .replace("'", '"')
+                                        .replace("\x00", "\\'"))
                 return json.loads(fixed_content)
             except Exception:
                 print("Error: Cannot fix company status file format.")
                 return {}
 
+def load_company_status(file_path: str) -> dict:
+    """Load a JSON file and attempt to fix formatting issues if necessary."""
+    try:
+        st = os.stat(file_path)
+        return _load_status_cached(file_path, st.st_mtime_ns, st.st_size)
+    except OSError as e:
+        print(f"Error loading company status file: {e}")
+        return {}
+
 def make_claude_api_call(prompt: str, max_retries: int = 5, initial_delay: float = 1.0) -> Any:
     """
     Make a Claude API call with retry logic and exponential backoff.
@@ -99,13 +134,15 @@ def make_claude_api_call(prompt: str, max_retries: int = 5, initial_delay: float
     
     for attempt in range(max_retries):
         try:
-            response = client.messages.create(
+            # Stream the response so processing can start as tokens arrive
+            # instead of waiting for the whole completion to be serialized
+            with client.messages.stream(
                 model="claude-3-5-sonnet-20241022",
                 max_tokens=300,
                 temperature=0.7,
                 messages=[{"role": "user", "content": prompt}]
-            )
-            return response
+            ) as stream:
+                return stream.get_final_message()
         except Exception as e:
             last_error = e
             if hasattr(e, 'status_code') and e.status_code == 529:
@@ -121,6 +158,36 @@ def make_claude_api_call(prompt: str, max_retries: int = 5, initial_delay: float
     # If we've exhausted all retries
     raise last_error
 
+# Prompt for career blurb generation, built once at import
+_PROMPT_TEMPLATE = (
+    "Write a professional career summary for {name}, "
+    "a {profession} with {years} years of experience, currently based in {location}. "
+    "Structure this as exactly two paragraphs with a blank line between them:\n\n"
+    "Paragraph 1: Focus on their overall experience and expertise (2-3 sentences).\n\n"
+    "Paragraph 2: Highlight their key strengths and notable professional achievements (2-3 sentences).\n\n"
+    "Use UK English and write in third person. Total length should be approximately 150 words."
+)
+
+def _write_enriched_json(resume_data: dict, enriched_json_path: str) -> None:
+    """Write the enriched resume JSON, using orjson's C serializer when available."""
+    if orjson is not None:
+        with open(enriched_json_path, 'wb') as f:
+            f.write(orjson.dumps(resume_data, option=orjson.OPT_INDENT_2))
+    else:
+        with open(enriched_json_path, 'w') as f:
+            json.dump(resume_data, f, indent=4)
+
+def _blurb_cache_path(resume_data: dict) -> Path:
+    """Return the on-disk cache path for a resume's generated blurb."""
+    if orjson is not None:
+        payload = orjson.dumps(resume_data, option=orjson.OPT_SORT_KEYS)
+    else:
+        payload = json.dumps(resume_data, sort_keys=True, default=str).encode('utf-8')
+    digest = hashlib.blake2b(payload, digest_size=16).hexdigest()
+    cache_dir = PATHS['OUTPUT'] / 'blurbs'
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    return cache_dir / f"{digest}.txt"
+
 def generate_blurb_with_claude(parsed_json_path: str) -> dict:
     """
     Calls Claude AI to generate a career blurb summarizing the CV.
@@ -134,93 +201,63 @@ def generate_blurb_with_claude(parsed_json_path: str) -> dict:
         # Load the parsed JSON data
         with open(parsed_json_path, 'r') as file:
             resume_data = json.load(file)
-        
+
+        # Identical resumes reuse the previously generated blurb instead of
+        # paying for another Claude call
+        # Bind the profile sections once instead of re-walking the dict chain
+        profile = resume_data.setdefault("data", {}).setdefault("profile", {})
+        basics = profile.setdefault("basics", {})
+        experiences = profile.get("professional_experiences", [])
+
+        cache_path = _blurb_cache_path(resume_data)
+        if cache_path.exists():
+            print(f"Using cached blurb from {cache_path}")
+            profile["blurb"] = cache_path.read_text(encoding='utf-8')
+            enriched_json_path = parsed_json_path.replace(".json", "_enriched.json")
+            _write_enriched_json(resume_data, enriched_json_path)
+            return {"path": enriched_json_path}
+
         # Extract candidate's first name and format it properly
-        basics = resume_data.get("data", {}).get("profile", {}).get("basics", {})
         raw_first_name = basics.get("first_name", "The candidate")
         first_name = format_name(raw_first_name)
-        
+
         # Calculate total years from professional experiences
-        experiences = resume_data.get("data", {}).get("profile", {}).get("professional_experiences", [])
-        nz_months = 0
-        international_months = 0
-        
-        for exp in experiences:
+        def duration_months(exp):
+            d = exp.get('duration_in_months')
             try:
-                duration_months = exp.get('duration_in_months')
-                if duration_months is None:
-                    continue
-                if isinstance(duration_months, str):
-                    duration_months = int(duration_months)
-                if not isinstance(duration_months, int):
-                    continue
-                
-                if exp.get('is_nz', False):
-                    nz_months += duration_months
-                else:
-                    international_months += duration_months
-            except (ValueError, TypeError):
-                continue
-        
+                return int(d) if d is not None else 0
+            except (TypeError, ValueError):
+                return 0
+
+        nz_months = sum(duration_months(e) for e in experiences if e.get('is_nz'))
+        international_months = sum(duration_months(e) for e in experiences if not e.get('is_nz'))
+
         # Round up years individually and sum them
-        def round_up_years(months):
-            return (months + 11) // 12
-            
-        nz_years = round_up_years(nz_months)
-        international_years = round_up_years(international_months)
+        nz_years = math.ceil(nz_months / 12)
+        international_years = math.ceil(international_months / 12)
         total_years = nz_years + international_years
         
         print(f"DEBUG: Calculated years - NZ: {nz_years}, International: {international_years}, Total: {total_years}")
-       
-        # Initialize prompt variable so that it's available in the if statement
-        prompt = None
 
         # Create a simpler prompt without focusing so much on the exact years
-        if not prompt:
-            profession = format_name(basics.get("profession", "professional"))
-            location = format_name(basics.get("address", ""))
-            
-            cv_context = f"""
-            Name: {first_name}
-            Professional Title: {profession}
-            Current Location: {location}
-            Total Years Experience: {total_years}
-            """
-            
-            prompt = (
-                f"Write a professional career summary for {first_name}, "
-                f"a {profession} with {total_years} years of experience, currently based in {location}. "
-                f"Structure this as exactly two paragraphs with a blank line between them:\n\n"
-                f"Paragraph 1: Focus on their overall experience and expertise (2-3 sentences).\n\n"
-                f"Paragraph 2: Highlight their key strengths and notable professional achievements (2-3 sentences).\n\n"
-                f"Use UK English and write in third person. Total length should be approximately 150 words."
-            )
-        
-        # Make API call with retry logic
-        max_retries = 5
-        initial_delay = 1.0
-        delay = initial_delay
-        response = None
+        profession = format_name(basics.get("profession", "professional"))
+        location = format_name(basics.get("address", ""))
+        prompt = _PROMPT_TEMPLATE.format(
+            name=first_name, profession=profession, years=total_years, location=location
+        )
+
+        # Make the API call; make_claude_api_call already retries with
+        # exponential backoff, so don't wrap it in a second retry loop
+        try:
+            response = make_claude_api_call(prompt)
+        except Exception as e:
+            print(f"Request to Claude API failed: {str(e)}")
+            return {
+                "success": False,
+                "message": "Our AI is having some problems, please wait a couple of minutes and then try uploading your CV again. If this problem persists, wait half an hour and hopefully Claude will have fixed itself by then :)",
+                "status": "error"
+            }
 
-        for attempt in range(max_retries):
-            try:
-                response = make_claude_api_call(prompt)
-                if response:
-                    break
-            except requests.exceptions.RequestException as e:
-                print(f"Request to Claude API failed: {str(e)}")
-                if attempt < max_retries - 1:
-                    print(f"Retrying in {delay:.2f} seconds...")
-                    time.sleep(delay)
-                    delay *= 2
-                else:
-                    print("Failed to generate blurb after multiple attempts")
-                    return {
-                        "success": False,
-                        "message": "Our AI is having some problems, please wait a couple of minutes and then try uploading your CV again. If this problem persists, wait half an hour and hopefully Claude will have fixed itself by then :)",
-                        "status": "error"
-                    }
-        
         # Process the response
         blurb = process_claude_response(response)
         print(f"Generated raw blurb with Claude: {blurb}")
@@ -228,14 +265,19 @@ def generate_blurb_with_claude(parsed_json_path: str) -> dict:
         # POST-PROCESSING: Fix years of experience in the blurb
         corrected_blurb = fix_years_of_experience(blurb, first_name, total_years)
         print(f"Corrected blurb: {corrected_blurb}")
-        
+
+        # Cache the blurb for future runs over the same resume
+        try:
+            cache_path.write_text(corrected_blurb, encoding='utf-8')
+        except OSError as e:
+            print(f"Warning: could not cache blurb: {e}")
+
         # Insert the corrected blurb into resume data
-        resume_data["data"]["profile"]["blurb"] = corrected_blurb
+        profile["blurb"] = corrected_blurb
         
         # Save the enriched JSON to a new file
         enriched_json_path = parsed_json_path.replace(".json", "_enriched.json")
-        with open(enriched_json_path, 'w') as file:
-            json.dump(resume_data, file, indent=4)
+        _write_enriched_json(resume_data, enriched_json_path)
 
         # Return the enriched file path so downstream code can use it
         return {"path": enriched_json_path}
@@ -244,25 +286,35 @@ def generate_blurb_with_claude(parsed_json_path: str) -> dict:
         print(f"Error generating blurb with Claude: {e}")
         return {"path": ""}
 
+# Matches the first "N years" / "N+ year" phrase in a blurb
+_YEARS_RE = re.compile(r"\b\d+\+?\s+years?\b", re.IGNORECASE)
+
 def fix_years_of_experience(blurb: str, name: str, correct_years: int) -> str:
     """
-    Fix mentions of years of experience in the blurb by creating a standardized
-    first sentence with the correct years and maintaining paragraph structure.
+    Fix mentions of years of experience in the blurb by substituting the
+    correct years into the first "N years" phrase, falling back to a
+    standardized first sentence when no such phrase exists.
     """
     if not blurb:
         return blurb
-        
-    # Split into paragraphs
+
+    # Common case: substitute the years in place without touching the
+    # paragraph structure
+    corrected = _YEARS_RE.sub(f"{correct_years} years", blurb, count=1)
+    if corrected != blurb:
+        return corrected
+
+    # No years phrase found - rewrite the first sentence instead
     paragraphs = [p.strip() for p in blurb.split('\n\n')]
     if not paragraphs:
         return blurb
-        
+
     # Process first paragraph
     cleaned = paragraphs[0]
     if cleaned.strip():
         # Create standardized first sentence
         first_sentence = f"{name} is a seasoned professional with {correct_years} years of experience."
-        
+
         # Find the first sentence end in the original paragraph
         sentence_end = cleaned.find('.')
         if sentence_end != -1:
@@ -271,9 +323,9 @@ def fix_years_of_experience(blurb: str, name: str, correct_years: int) -> str:
         else:
             # If no sentence end found, use the standardized sentence
             cleaned = first_sentence
-            
+
         paragraphs[0] = cleaned.strip()
-    
+
     # Rejoin paragraphs with double newlines
     return '\n\n'.join(p for p in paragraphs if p.strip())
 
@@ -1,11 +1,29 @@
+import errno
 import os
+import re
 from pathlib import Path
 import logging
 import shutil
+import threading
 import time
 
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 
+# Matches trailing collision counters like "_1" / "_23" on base names
+_TRAILING_COUNT_RE = re.compile(r'_\d+$')
+
+def _unlink_with_retry(path: str):
+    """Remove a file, retrying once on transient busy/permission errors."""
+    try:
+        os.unlink(path)
+    except OSError as e:
+        # On network filesystems EBUSY/EACCES can be transient while another
+        # process still holds the file; one short retry usually clears it
+        if e.errno not in (errno.EBUSY, errno.EACCES):
+            raise
+        time.sleep(0.01)
+        os.unlink(path)
+
 def cleanup_duplicate_files(directory: str, user_downloads_dir: str = None):
     """
     Remove duplicate CV files from the outputs directory and optionally from the 
@@ -33,49 +51,75 @@ def cleanup_directory(directory: str):
     if not dir_path.exists():
         logging.warning(f"Directory does not exist: {directory}")
         return
-    
-    # Group files by base name (without _CV suffix and numbers)
-    file_groups = {}
-    for file in dir_path.iterdir():
-        if not file.is_file() or not file.name.endswith('.docx'):
-            continue
-            
-        # Get the base name without _CV suffix and counters
-        base_name = file.stem
-        if '_CV' in base_name:
-            base_name = base_name.split('_CV')[0]
-        
-        # Remove any trailing numbers from the base name
-        import re
-        base_name = re.sub(r'_\d+$', '', base_name)
-        
-        if base_name not in file_groups:
-            file_groups[base_name] = []
-            
-        file_groups[base_name].append(file)
-    
-    # For each group, keep only the most recent file
-    for base_name, files in file_groups.items():
-        if len(files) <= 1:
-            continue
-            
-        # Sort by modification time (most recent first)
-        files.sort(key=lambda f: os.path.getmtime(f), reverse=True)
-        
-        # Keep the most recent file, delete the rest
-        logging.info(f"Keeping most recent file: {files[0].name}")
-        for file_to_delete in files[1:]:
-            logging.info(f"Removing duplicate file: {file_to_delete.name}")
+
+    # Single pass: track only the newest (mtime, path) per base name and
+    # push anything older straight onto the delete list. Finding the max
+    # this way is O(n) with no per-group sort at the end.
+    best = {}
+    to_delete = {}
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            if not entry.is_file(follow_symlinks=False) or not entry.name.endswith('.docx'):
+                continue
+
+            # Get the base name without _CV suffix and counters
+            base_name = Path(entry.name).stem.partition('_CV')[0]
+
+            # Remove any trailing numbers from the base name
+            base_name = _TRAILING_COUNT_RE.sub('', base_name)
+
+            # DirEntry.stat() reuses the data from the scandir listing, so
+            # reading the mtime here costs no extra syscall
+            candidate = (entry.stat().st_mtime_ns, entry.path)
+            current = best.get(base_name)
+            if current is None:
+                best[base_name] = candidate
+            elif candidate > current:
+                best[base_name] = candidate
+                to_delete.setdefault(base_name, []).append(current[1])
+            else:
+                to_delete.setdefault(base_name, []).append(candidate[1])
+
+    # Delete the superseded files, logging once per group instead of once
+    # per file
+    for base_name, paths in to_delete.items():
+        removed = []
+        for path_to_delete in paths:
             try:
-                file_to_delete.unlink()
-            except Exception as e:
-                logging.error(f"Failed to delete {file_to_delete}: {e}")
+                _unlink_with_retry(path_to_delete)
+                removed.append(os.path.basename(path_to_delete))
+            except OSError as e:
+                logging.error(f"Failed to delete {path_to_delete}: {e}")
+
+        if removed:
+            logging.info("Kept %s, removed %d duplicate(s): %s",
+                         os.path.basename(best[base_name][1]), len(removed), ", ".join(removed))
+
+# Signal this to shut the periodic cleanup loop down gracefully
+cleanup_stop_event = threading.Event()
+
+def cleanup_outputs_periodically(interval=3600, stop_event=None):  # Run every hour
+    """Run cleanup periodically in background until stop_event is set."""
+    stop = stop_event if stop_event is not None else cleanup_stop_event
+    last_mtime = None
 
-def cleanup_outputs_periodically(interval=3600):  # Run every hour
-    """Run cleanup periodically in background"""
     while True:
-        cleanup_duplicate_files('outputs')
-        time.sleep(interval)
+        # Skip the whole pass when the directory hasn't changed since the
+        # last run; deletions below bump the mtime, so re-read it after
+        try:
+            mtime = os.stat('outputs').st_mtime
+        except OSError:
+            mtime = None
+
+        if mtime is not None and mtime != last_mtime:
+            cleanup_duplicate_files('outputs')
+            try:
+                last_mtime = os.stat('outputs').st_mtime
+            except OSError:
+                last_mtime = None
+
+        if stop.wait(interval):
+            return
 
 if __name__ == "__main__":
     # Run a one-time cleanup of the outputs directory
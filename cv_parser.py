@@ -4,9 +4,16 @@ CV Parser module for extracting structured information from CV documents.
 
 import os
 import json
-import base64
+import queue
+import random
 import requests
+import threading
 import time
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 from pathlib import Path
 from typing import Optional, Dict, Any, List, Tuple
 from dotenv import load_dotenv
@@ -15,10 +22,6 @@ from file_tracker import track_file
 from unified_logger import log_info, log_error, log_warning, log_debug, log_operation_success
 import tempfile
 from datetime import datetime
-import firebase_admin
-from firebase_admin import storage
-from firebase_admin import firestore
-from firebase_admin import credentials
 
 # Load environment variables
 load_dotenv('config.env')
@@ -28,9 +31,23 @@ PARSER_API_URL = os.environ.get("PARSER_API_URL", "https://cvparser.ai/api/v4/pa
 PARSER_API_KEY = os.environ.get("PARSER_API_KEY", "")
 CVPARSER_TIMEOUT = int(os.getenv('CVPARSER_TIMEOUT_SECONDS', '45'))
 
+# Upper bound on a single retry sleep so a failing CV can't block a worker
+# for the full 1+2+4+8+16s exponential sequence
+MAX_BACKOFF = 8.0
+
+def _backoff_time(initial_delay: float, attempt: int) -> float:
+    """Bounded exponential backoff with jitter to avoid thundering herds."""
+    return min(MAX_BACKOFF, initial_delay * (2 ** attempt)) * random.uniform(0.5, 1.0)
+
 print(f"Debug - API URL: {PARSER_API_URL}")
 print(f"Debug - API Key loaded: {'Yes' if PARSER_API_KEY else 'No'} (Length: {len(PARSER_API_KEY)})")
 
+# Shared session so the PDF download and parser POST (plus any retries)
+# reuse pooled TLS connections instead of handshaking per request
+_SESSION = requests.Session()
+_SESSION.mount('https://', requests.adapters.HTTPAdapter(
+    pool_connections=4, pool_maxsize=16, max_retries=0))
+
 # Define paths
 PATHS = {
     'UPLOADS': Path('uploads'),
@@ -38,33 +55,71 @@ PATHS = {
     'OUTPUTS': Path('outputs')
 }
 
-# Ensure directories exist
-for path in PATHS.values():
-    path.mkdir(exist_ok=True)
+# Local alias for the hot path, skipping the PATHS dict lookup per call
+_PARSED_DIR = PATHS['PARSED_JSON']
+
+# Directories are created lazily on first parser construction rather than at
+# import, so merely importing this module (Flask reloader, gunicorn workers,
+# the cleanup CLI) costs no mkdir syscalls
+_DIRS_READY = False
+
+def _ensure_dirs() -> None:
+    """Create the working directories once per process."""
+    global _DIRS_READY
+    if not _DIRS_READY:
+        for path in PATHS.values():
+            os.makedirs(str(path), exist_ok=True)
+        _DIRS_READY = True
+
+# Tracker events are recorded off the parse path: call sites enqueue and a
+# daemon thread invokes the real track_file, so tracker I/O never serializes
+# with the download/parse pipeline
+_TRACK_Q = queue.SimpleQueue()
 
-def make_parser_api_call(url: str, headers: Dict[str, str], payload: Dict[str, Any], 
+def _track_consumer():
+    while True:
+        args = _TRACK_Q.get()
+        try:
+            track_file(*args)
+        except Exception as e:
+            print(f"File tracking error: {e}")
+
+threading.Thread(target=_track_consumer, daemon=True,
+                 name="cv_parser_tracker").start()
+
+def _track(file_path: str, stage: str, action: str, details: str = "") -> None:
+    """Queue a track_file event for the background consumer."""
+    _TRACK_Q.put((file_path, stage, action, details))
+
+def make_parser_api_call(url: str, headers: Dict[str, str], pdf_bytes: bytes,
                         max_retries: int = 5, initial_delay: float = 1.0) -> Optional[Dict[str, Any]]:
     """
     Make a CV parser API call with retry logic and exponential backoff.
-    
+
+    The PDF is uploaded as multipart/form-data rather than a base64 JSON
+    payload, avoiding the encode pass, the json.dumps of a multi-MB string
+    and the ~33% base64 overhead on the wire.
+
     Args:
         url: The API endpoint URL
-        headers: Request headers
-        payload: Request payload
+        headers: Request headers (Content-Type is set by the multipart body)
+        pdf_bytes: Raw PDF content to upload
         max_retries: Maximum number of retry attempts
         initial_delay: Initial delay in seconds between retries
-        
+
     Returns:
         The API response as a dictionary or None if all retries fail
     """
     delay = initial_delay
-    
+
     for attempt in range(max_retries):
         try:
-            response = requests.post(
+            # bytes (not a file object) so the body can be re-sent on retry
+            response = _SESSION.post(
                 url,
                 headers=headers,
-                json=payload,
+                files={'file': ('cv.pdf', pdf_bytes, 'application/pdf')},
+                data={'wait': 'true'},
                 timeout=CVPARSER_TIMEOUT
             )
             
@@ -75,7 +130,12 @@ def make_parser_api_call(url: str, headers: Dict[str, str], payload: Dict[str, A
             # If the error is retryable (server errors 5xx)
             if 500 <= response.status_code < 600:
                 if attempt < max_retries - 1:
-                    sleep_time = delay * (2 ** attempt)  # Exponential backoff
+                    sleep_time = _backoff_time(delay, attempt)
+                    # Honor the server's Retry-After hint when it sends one
+                    try:
+                        sleep_time = float(response.headers.get('Retry-After', sleep_time))
+                    except (TypeError, ValueError):
+                        pass
                     print(f"Parser API error {response.status_code}. Retrying in {sleep_time:.2f} seconds...")
                     time.sleep(sleep_time)
                     continue
@@ -91,7 +151,7 @@ def make_parser_api_call(url: str, headers: Dict[str, str], payload: Dict[str, A
             
         except requests.exceptions.RequestException as e:
             if attempt < max_retries - 1:
-                sleep_time = delay * (2 ** attempt)
+                sleep_time = _backoff_time(delay, attempt)
                 print(f"Parser API request failed: {str(e)}. Retrying in {sleep_time:.2f} seconds...")
                 time.sleep(sleep_time)
                 continue
@@ -105,6 +165,7 @@ class CVParser:
     
     def __init__(self):
         """Initialize the CV parser with LocationService"""
+        _ensure_dirs()
         self.location_service = LocationService()
     
     def send_to_cv_parser(self, file_url: str) -> Optional[Dict[str, Any]]:
@@ -119,73 +180,57 @@ class CVParser:
         """
         try:
             # Track the start of the parsing process
-            track_file(file_url, "parse", "starting", "Beginning CV parsing process")
+            _track(file_url, "parse", "starting", "Beginning CV parsing process")
             
-            # 1. Download PDF content from file_url
-            response = requests.get(file_url)
+            # 1. Download the raw PDF content from file_url. It is re-uploaded
+            # as-is via multipart, so no base64 copy is ever made: peak memory
+            # stays at one PDF's worth of bytes.
+            response = _SESSION.get(file_url)
             if response.status_code != 200:
                 print(f"Error downloading PDF: {response.status_code}")
-                track_file(file_url, "parse", "failed", f"Error downloading PDF: {response.status_code}")
+                _track(file_url, "parse", "failed", f"Error downloading PDF: {response.status_code}")
                 return None
 
-            pdf_content = response.content
-            base64_pdf = base64.b64encode(pdf_content).decode('utf-8')
-            track_file(file_url, "parse", "downloaded", "PDF downloaded successfully")
+            pdf_bytes = response.content
+            _track(file_url, "parse", "downloaded", "PDF downloaded successfully")
 
             headers = {
-                'Content-Type': 'application/json',
                 'X-API-Key': PARSER_API_KEY
             }
 
-            payload = {
-                'base64': base64_pdf,
-                'filename': 'cv.pdf',
-                'wait': True
-            }
-
             print("Sending to parser API...")
-            track_file(file_url, "parse", "requesting", "Sending PDF to parser API")
-            
+            _track(file_url, "parse", "requesting", "Sending PDF to parser API")
+
             try:
                 # Use the retry mechanism with configurable timeout
-                parsed_data = make_parser_api_call(PARSER_API_URL, headers, payload)
+                parsed_data = make_parser_api_call(PARSER_API_URL, headers, pdf_bytes)
                 if not parsed_data:
-                    track_file(file_url, "parse", "failed", "Parser API call failed or timed out")
+                    _track(file_url, "parse", "failed", "Parser API call failed or timed out")
                     return None
 
-                track_file(file_url, "parse", "received", "Received parsed data from API")
-
-                # Add location classification to each experience
-                for exp in parsed_data.get('data', {}).get('profile', {}).get('professional_experiences', []):
-                    location = exp.get('location', '')
-                    exp['is_nz'] = self.location_service.is_nz_location(location)
-                    print(f"Location '{location}' classified as {'NZ' if exp['is_nz'] else 'International'}")
-                    
-                    # If location is empty, try using company name
-                    if not location and 'company' in exp:
-                        company = exp.get('company', '')
-                        exp['is_nz'] = self.location_service.is_nz_location(company)
-                        print(f"Company '{company}' classified as {'NZ' if exp['is_nz'] else 'International'}")
-
-                # Save and track the parsed data
-                saved_result = self.save_parsed_data(parsed_data, file_url)
-                
-                # Extract file path for tracking
-                base_name = Path(file_url).stem
-                json_path = PATHS['PARSED_JSON'] / f"parsed_{base_name}.json"
-                track_file(str(json_path), "parse", "saved", "Parsed data saved to JSON")
+                _track(file_url, "parse", "received", "Received parsed data from API")
+
+                # Add location classification to each experience, falling back
+                # to the company name when the location is empty. One batched
+                # call classifies all experiences.
+                experiences = parsed_data.get('data', {}).get('profile', {}).get('professional_experiences', [])
+                candidates = [exp.get('location') or exp.get('company', '') for exp in experiences]
+                for exp, is_nz in zip(experiences, self.location_service.is_nz_location_many(candidates)):
+                    exp['is_nz'] = is_nz
 
-                return saved_result
+                # Save and track the parsed data; save_parsed_data already
+                # computes the JSON path and emits the "saved" track event
+                return self.save_parsed_data(parsed_data, file_url)
 
             except requests.Timeout:
                 msg = "Complex file structure found, please save this resume as a PDF then upload again, this should solve the problem."
-                track_file(file_url, "parse", "timeout", f"Parser API request timed out after {CVPARSER_TIMEOUT} seconds")  # Add the timeout value
+                _track(file_url, "parse", "timeout", f"Parser API request timed out after {CVPARSER_TIMEOUT} seconds")  # Add the timeout value
                 print(f"Parser API timed out after {CVPARSER_TIMEOUT} seconds")  # Update to use CVPARSER_TIMEOUT variable
                 return None
                 
         except Exception as e:
             print(f"Parser error: {e}")
-            track_file(file_url, "parse", "error", f"Parser error: {str(e)}")
+            _track(file_url, "parse", "error", f"Parser error: {str(e)}")
             import traceback
             traceback.print_exc()
             return None
@@ -216,7 +261,7 @@ class CVParser:
                 return ""
                 
             # Return path to the JSON file that would have been created
-            json_path = str(PATHS['PARSED_JSON'] / f"parsed_{base_name}.json")
+            json_path = str(_PARSED_DIR / f"parsed_{base_name}.json")
             return json_path
             
         except Exception as e:
@@ -239,19 +284,24 @@ class CVParser:
         try:
             # Generate output filename from the URL
             base_name = Path(os.path.basename(file_url)).stem
-            json_path = PATHS['PARSED_JSON'] / f"parsed_{base_name}.json"
+            json_path = _PARSED_DIR / f"parsed_{base_name}.json"
             
-            track_file(str(json_path), "parse", "saving", "Saving parsed data to JSON")
+            _track(str(json_path), "parse", "saving", "Saving parsed data to JSON")
             
             # Ensure the directory exists
             json_path.parent.mkdir(exist_ok=True)
             
-            # Write the parsed data to a JSON file
-            with open(json_path, 'w', encoding='utf-8') as f:
-                json.dump(parsed_data, f, indent=2, ensure_ascii=False)
+            # Write the parsed data to a JSON file; orjson emits UTF-8 bytes
+            # directly so the write skips the text-mode encoder entirely
+            if orjson is not None:
+                json_path.write_bytes(
+                    orjson.dumps(parsed_data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+            else:
+                with open(json_path, 'w', encoding='utf-8') as f:
+                    json.dump(parsed_data, f, indent=2, ensure_ascii=False)
                 
             print(f"Parsed data saved to {json_path}")
-            track_file(str(json_path), "parse", "saved", "Parsed data saved successfully")
+            _track(str(json_path), "parse", "saved", "Parsed data saved successfully")
             
             return {"path": str(json_path)}
         except Exception as e:
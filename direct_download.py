@@ -1,18 +1,15 @@
-import os
-import platform
 import shutil
+import time
 from pathlib import Path
 from typing import Optional, Union
 from utils import sanitize_filename  # Import the utility function
 
+# All supported platforms use ~/Downloads, so compute it once at import
+DOWNLOADS_FOLDER = Path.home() / "Downloads"
+
 def get_downloads_folder() -> Path:
-    """Get the user's downloads folder path based on the operating system."""
-    if platform.system() == "Windows":
-        return Path(os.path.expanduser("~")) / "Downloads"
-    elif platform.system() == "Darwin":  # macOS
-        return Path(os.path.expanduser("~")) / "Downloads"
-    else:  # Linux and other Unix
-        return Path(os.path.expanduser("~")) / "Downloads"  # Most Linux distros use this
+    """Get the user's downloads folder path."""
+    return DOWNLOADS_FOLDER
 
 def save_output_to_downloads(output_file_path: Union[str, Path], 
                              new_filename: Optional[str] = None) -> Optional[Path]:
@@ -63,15 +60,15 @@ def save_output_to_downloads(output_file_path: Union[str, Path],
         # Use the sanitized filename
         dest_path = downloads_folder / sanitized_filename
         
-        # If file exists, add a counter with UNDERSCORE (not hyphen)
-        counter = 1
-        original_stem = dest_path.stem
-        while dest_path.exists():
-            dest_path = downloads_folder / f"{original_stem}_{counter}{dest_path.suffix}"
-            counter += 1
+        # If file exists, jump straight to a unique UNDERSCORE suffix instead
+        # of probing _1, _2, ... with a stat call per counter
+        if dest_path.exists():
+            dest_path = downloads_folder / f"{dest_path.stem}_{time.time_ns():x}{dest_path.suffix}"
         
-        # Copy the file to the downloads folder
-        shutil.copy2(output_path, dest_path)
+        # Copy the file contents to the downloads folder; copyfile skips the
+        # metadata stats and chmod that copy2 performs, which the Downloads
+        # copy doesn't need
+        shutil.copyfile(output_path, dest_path)
         
         # Verify the copied file
         if not dest_path.exists():
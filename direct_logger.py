@@ -2,6 +2,8 @@
 import os
 import sys
 import time
+import atexit
+import threading
 from datetime import datetime
 
 # Direct file path - use desktop for visibility
@@ -9,16 +11,57 @@ HOME_DIR = os.path.expanduser("~")
 DESKTOP_DIR = os.path.join(HOME_DIR, "Desktop")
 LOG_FILE = os.path.join(DESKTOP_DIR, "flask_direct_log.txt")
 
+# Seconds between background fsyncs of the shared handle
+FSYNC_INTERVAL = 5.0
+
+# Cache the formatted seconds so strftime runs once per second, not per message
+_LAST_TS_SEC = 0
+_LAST_TS_STR = ""
+
+def _fast_ts():
+    """ISO 8601 timestamp with a cached seconds prefix."""
+    global _LAST_TS_SEC, _LAST_TS_STR
+    t = time.time()
+    s = int(t)
+    if s != _LAST_TS_SEC:
+        _LAST_TS_SEC = s
+        _LAST_TS_STR = time.strftime("%Y-%m-%dT%H:%M:%S", time.localtime(s))
+    return f"{_LAST_TS_STR}.{int((t - s) * 1e6):06d}"
+
+# Line-buffered handle shared by all log calls, opened on first use
+_LOG_FH = None
+
+def _fsync_periodically():
+    """Background thread: push buffered log data to disk every few seconds."""
+    while True:
+        time.sleep(FSYNC_INTERVAL)
+        try:
+            os.fsync(_LOG_FH.fileno())
+        except (OSError, ValueError, AttributeError):
+            return
+
+def _get_log_fh():
+    """Open the shared log handle once and start the background fsync."""
+    global _LOG_FH
+    if _LOG_FH is None:
+        _LOG_FH = open(LOG_FILE, "a", buffering=1, encoding="utf-8")
+        atexit.register(_LOG_FH.close)
+        threading.Thread(target=_fsync_periodically, daemon=True).start()
+    return _LOG_FH
+
+def flush():
+    """Force buffered log data to disk (for critical paths)."""
+    if _LOG_FH is not None:
+        _LOG_FH.flush()
+        os.fsync(_LOG_FH.fileno())
+
 def log_message(message, level="INFO"):
     """Write a message directly to the log file."""
-    timestamp = datetime.now().isoformat()
+    timestamp = _fast_ts()
     formatted_message = f"{timestamp} - {level} - {message}\n"
-    
+
     try:
-        with open(LOG_FILE, "a", encoding="utf-8") as f:
-            f.write(formatted_message)
-            f.flush()
-            os.fsync(f.fileno())
+        _get_log_fh().write(formatted_message)
         print(f"{level}: {message}")
     except Exception as e:
         print(f"ERROR writing to log file: {e}")
@@ -41,15 +84,14 @@ def init():
     """Initialize the log file."""
     try:
         # Create a header in the log file
-        with open(LOG_FILE, "a", encoding="utf-8") as f:
-            f.write(f"\n{'='*50}\n")
-            f.write(f"=== Log started at {datetime.now().isoformat()} ===\n")
-            f.write(f"=== PID: {os.getpid()} ===\n")
-            f.write(f"=== CWD: {os.getcwd()} ===\n")
-            f.write(f"=== Python: {sys.version} ===\n")
-            f.write(f"{'='*50}\n\n")
-            f.flush()
-            os.fsync(f.fileno())
+        f = _get_log_fh()
+        f.write(f"\n{'='*50}\n")
+        f.write(f"=== Log started at {datetime.now().isoformat()} ===\n")
+        f.write(f"=== PID: {os.getpid()} ===\n")
+        f.write(f"=== CWD: {os.getcwd()} ===\n")
+        f.write(f"=== Python: {sys.version} ===\n")
+        f.write(f"{'='*50}\n\n")
+        flush()
         return True
     except Exception as e:
         print(f"ERROR initializing log file: {e}")
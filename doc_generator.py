@@ -1,16 +1,37 @@
+import io
 import os
 import sys
+import copy
 import json
+import functools
 import traceback
 import logging  # Added logging import
 import re  # Add re module for regex operations
+import threading
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, NamedTuple, Optional
 from docx import Document
 from docxtpl import DocxTemplate
+
+# orjson parses and serializes severalfold faster than stdlib json; fall
+# back silently when it isn't installed
+try:
+    import orjson
+except ImportError:
+    orjson = None
 from location_service import LocationService
+from file_tracker import track_file
 from spellchecker import SpellChecker
 
+# Optional fast spell backend: SymSpell looks up corrections via precomputed
+# deletes instead of enumerating edit candidates in Python, so correction()
+# drops from milliseconds to microseconds per unknown word
+try:
+    from symspellpy import SymSpell, Verbosity
+except ImportError:
+    SymSpell = None
+
 # Ensure the project directory is in the Python path
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
@@ -28,39 +49,134 @@ ENABLE_SPELL_CHECK = False  # Default to False
 os.makedirs(OUTPUTS_DIR, exist_ok=True)
 os.makedirs(TEMPLATES_DIR, exist_ok=True)
 
+@functools.lru_cache(maxsize=1024)
+def _output_path_for(json_path: str) -> str:
+    """Canonical output path for a parsed-JSON input.
+
+    Pure function of json_path, so retries and regenerations of the same
+    CV skip the stem/sanitize/join work and always agree on one path."""
+    # Plain string ops beat PurePath construction for a simple stem; a
+    # leading dot (hidden file) is not an extension separator
+    name = json_path.replace('\\', '/').rsplit('/', 1)[-1]
+    dot = name.rfind('.')
+    base_name = name[:dot] if dot > 0 else name
+    base_name = base_name.removesuffix('_enriched')
+    return f"{OUTPUTS_DIR}{os.sep}{sanitize_filename(base_name)}_CV.docx"
+
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 
+class _SymSpellAdapter:
+    """Expose pyspellchecker's known()/correction() interface over SymSpell
+    so auto_correct_text works unchanged with either backend."""
+
+    def __init__(self, sym):
+        self._sym = sym
+
+    def known(self, words):
+        return {w for w in words
+                if self._sym.lookup(w, Verbosity.TOP, max_edit_distance=0)}
+
+    def correction(self, word):
+        suggestions = self._sym.lookup(word, Verbosity.CLOSEST,
+                                       max_edit_distance=2, include_unknown=True)
+        return suggestions[0].term if suggestions else word
+
+# Common industry-specific terms and job titles, built once at import
+_INDUSTRY_TERMS = frozenset({
+    # Job Titles
+    'foreman', 'supervisor', 'technician', 'operator', 'mechanic', 'electrician',
+    'plumber', 'welder', 'carpenter', 'builder', 'fitter', 'turner', 'machinist',
+    'rigger', 'scaffolder', 'painter', 'laborer', 'labourer', 'apprentice',
+    'trainee', 'installer', 'assembler', 'driver', 'operator', 'storeman',
+    'storeperson', 'yardman', 'tradesman', 'tradie', 'handyman', 'ductman',
+
+    # Equipment and Skills
+    'hvac', 'forklift', 'excavator', 'bobcat', 'scissorlift', 'crane',
+    'bulldozer', 'grader', 'loader', 'digger', 'telehandler', 'manlift',
+    'mig', 'tig', 'gmaw', 'smaw', 'fcaw', 'stick', 'plasma',
+
+    # Certifications and Standards
+    'ohs', 'whs', 'iso', 'haccp', 'tafe', 'cert', 'ppe', 'swms', 'sop',
+    'msds', 'sds', 'jsa', 'jha', 'asme', 'osha', 'confined',
+
+    # Common Industry Words
+    'warehousing', 'logistics', 'dispatch', 'receiving', 'shipping',
+    'maintenance', 'repair', 'installation', 'construction', 'fabrication',
+    'assembly', 'production', 'manufacturing', 'industrial', 'commercial',
+    'residential', 'mechanical', 'electrical', 'hydraulic', 'pneumatic'
+})
+
 # Initialize spell checker with industry-specific words
 def initialize_spell_checker():
+    industry_terms = _INDUSTRY_TERMS
+
+    if SymSpell is not None:
+        try:
+            import importlib.resources
+            sym = SymSpell(max_dictionary_edit_distance=2, prefix_length=7)
+            dictionary_path = importlib.resources.files('symspellpy').joinpath(
+                'frequency_dictionary_en_82_765.txt')
+            sym.load_dictionary(str(dictionary_path), term_index=0, count_index=1)
+            for term in industry_terms:
+                sym.create_dictionary_entry(term, 1)
+            return _SymSpellAdapter(sym)
+        except Exception as e:
+            logging.warning(f"SymSpell initialization failed, falling back to pyspellchecker: {e}")
+
     spell = SpellChecker()
-    # Add common industry-specific terms and job titles
-    industry_terms = {
-        # Job Titles
-        'foreman', 'supervisor', 'technician', 'operator', 'mechanic', 'electrician',
-        'plumber', 'welder', 'carpenter', 'builder', 'fitter', 'turner', 'machinist',
-        'rigger', 'scaffolder', 'painter', 'laborer', 'labourer', 'apprentice',
-        'trainee', 'installer', 'assembler', 'driver', 'operator', 'storeman',
-        'storeperson', 'yardman', 'tradesman', 'tradie', 'handyman', 'ductman',
-        
-        # Equipment and Skills
-        'hvac', 'forklift', 'excavator', 'bobcat', 'scissorlift', 'crane',
-        'bulldozer', 'grader', 'loader', 'digger', 'telehandler', 'manlift',
-        'mig', 'tig', 'gmaw', 'smaw', 'fcaw', 'stick', 'plasma',
-        
-        # Certifications and Standards
-        'ohs', 'whs', 'iso', 'haccp', 'tafe', 'cert', 'ppe', 'swms', 'sop',
-        'msds', 'sds', 'jsa', 'jha', 'asme', 'osha', 'confined',
-        
-        # Common Industry Words
-        'warehousing', 'logistics', 'dispatch', 'receiving', 'shipping',
-        'maintenance', 'repair', 'installation', 'construction', 'fabrication',
-        'assembly', 'production', 'manufacturing', 'industrial', 'commercial',
-        'residential', 'mechanical', 'electrical', 'hydraulic', 'pneumatic'
-    }
     spell.word_frequency.load_words(industry_terms)
     return spell
 
+# Shared spell checker: loading the dictionary is expensive, so build it once
+# per process and reuse it across DocGenerator instances
+_SPELL_SINGLETON = None
+_SPELL_LOCK = threading.Lock()
+
+def get_spell_checker():
+    """Return the shared spell checker, building it once under a lock."""
+    global _SPELL_SINGLETON
+    if _SPELL_SINGLETON is None:
+        with _SPELL_LOCK:
+            if _SPELL_SINGLETON is None:
+                _SPELL_SINGLETON = initialize_spell_checker()
+    return _SPELL_SINGLETON
+
+# Tokenizer for auto_correct_text: words plus the punctuation it preserves,
+# compiled once instead of via the re cache on every text
+_TOKEN_RE = re.compile(r"[\w']+|[.,!?;]")
+_PUNCT_SET = frozenset('.,!?;')
+
+# Captures balanced parenthesised groups so re.split keeps them as parts
+_PAREN_RE = re.compile(r'(\([^)]*\))')
+
+# Cache of suggestions keyed by (spell checker id, lowercase token).
+# Employers and positions repeat the same words across CV entries, so each
+# unique token pays the edit-distance search in correction() only once.
+# Cleared wholesale when it hits the cap so a long batch can't grow it
+# without bound.
+_SPELL_CACHE = {}
+_SPELL_CACHE_MAX = 4096
+
+def _correct_token(word_lower: str, spell: SpellChecker) -> str:
+    """Return the suggested spelling for a lowercase token, memoized.
+
+    Known words come back unchanged, encoding the known() short-circuit in
+    the cache as well.
+    """
+    key = (id(spell), word_lower)
+    try:
+        return _SPELL_CACHE[key]
+    except KeyError:
+        if spell.known([word_lower]):
+            corrected = word_lower
+        else:
+            corrected = spell.correction(word_lower) or word_lower
+        if len(_SPELL_CACHE) >= _SPELL_CACHE_MAX:
+            _SPELL_CACHE.clear()
+        _SPELL_CACHE[key] = corrected
+        return corrected
+
 def debug_spell_correction(original: str, corrected: str, word_type: str = "word"):
     """Log debug information about spell corrections."""
     if original != corrected:
@@ -68,39 +184,51 @@ def debug_spell_correction(original: str, corrected: str, word_type: str = "word
         logging.debug(f"Corrected {word_type}: '{corrected}'")
         logging.debug(f"Changed: {'Yes' if original != corrected else 'No'}")
 
-def auto_correct_text(text: str, spell: SpellChecker, word_type: str = "text") -> str:
+def auto_correct_text(text: str, spell: SpellChecker, word_type: str = "text",
+                      known_words: Optional[set] = None) -> str:
     """
     Automatically correct obvious spelling mistakes while preserving case and formatting.
     Added debugging output for corrections.
     """
     if not text:
         return text
-        
+
     # Split into words while preserving punctuation
-    def split_with_punctuation(s):
-        import re
-        return re.findall(r"[\w']+|[.,!?;]", s)
-        
-    words = split_with_punctuation(text)
+    words = _TOKEN_RE.findall(text)
+
+    # One batched known() call over every checkable token, instead of a
+    # list-of-one call per word; if nothing is unknown the text is already
+    # clean and the correction loop can be skipped entirely. Callers that
+    # pre-checked a larger batch pass the result in via known_words.
+    candidates = {w.lower() for w in words
+                  if len(w) > 2 and w.isalpha() and not w.isupper()}
+    if known_words is not None:
+        unknown = candidates - known_words
+    else:
+        unknown = candidates - spell.known(candidates) if candidates else set()
+    if not unknown:
+        return text
+
     corrected_words = []
     any_corrections = False
-    
+
     for word in words:
-        # Skip punctuation, numbers, and short words
-        if not word.isalpha() or word.isnumeric() or len(word) <= 2:
+        # Skip punctuation, numbers and short words; length check first as
+        # the cheapest predicate, and isalpha() already excludes numerics
+        if len(word) <= 2 or not word.isalpha():
             corrected_words.append(word)
             continue
-            
+
         # Skip words with all caps (likely acronyms)
         if word.isupper():
             corrected_words.append(word)
             continue
-            
-        # Check if word is misspelled
+
+        # Only tokens the batched known() call flagged need a correction
         word_lower = word.lower()
-        if not spell.known([word_lower]):
-            correction = spell.correction(word_lower)
-            if correction and correction != word_lower:
+        if word_lower in unknown:
+            correction = _correct_token(word_lower, spell)
+            if correction != word_lower:
                 # Preserve original capitalization
                 if word.istitle():
                     correction = correction.title()
@@ -112,16 +240,23 @@ def auto_correct_text(text: str, spell: SpellChecker, word_type: str = "text") -
         
         corrected_words.append(word)
     
-    # Reconstruct text with proper spacing
-    result = ""
+    # Every unknown token may still come back unchanged from correction();
+    # in that case the original string is already the answer and the
+    # reconstruction pass below would just rebuild it character for character
+    if not any_corrections:
+        return text
+
+    # Reconstruct text with proper spacing; build a list and join once so
+    # the output isn't recopied on every concatenation
+    out = []
     for i, word in enumerate(corrected_words):
-        if i > 0 and word not in ".,!?;":
-            result += " "
-        result += word
-    
-    if any_corrections:
-        debug_spell_correction(text, result, word_type)
-    
+        if i > 0 and word not in _PUNCT_SET:
+            out.append(' ')
+        out.append(word)
+    result = ''.join(out)
+
+    debug_spell_correction(text, result, word_type)
+
     return result
 
 def spell_check_context(context: Dict[str, Any], spell: SpellChecker) -> Dict[str, Any]:
@@ -131,44 +266,78 @@ def spell_check_context(context: Dict[str, Any], spell: SpellChecker) -> Dict[st
     logging.info("Starting spell check")
     
     # Focus only on employment-related fields
-    employer_fields = ['nzemployers', 'internationalemployers']
-    position_fields = ['nzpositions', 'internationalpositions']
-    
-    # Process employer lists
-    for field in employer_fields:
-        if field in context and isinstance(context[field], str):
-            if context[field] != "None":
-                logging.info(f"Checking employers in {field}:")
-                lines = context[field].split('\n')
-                corrected_lines = []
-                for line in lines:
-                    if line.startswith('• '):
-                        original = line[2:].strip()
-                        corrected = auto_correct_text(original, spell, "employer name")
-                        corrected_lines.append(f"• {corrected}")
-                    else:
-                        corrected_lines.append(line)
-                context[field] = '\n'.join(corrected_lines)
-    
-    # Process position/job title lists
-    for field in position_fields:
-        if field in context and isinstance(context[field], str):
-            if context[field] != "None":
-                logging.info(f"Checking job titles in {field}:")
-                lines = context[field].split('\n')
-                corrected_lines = []
-                for line in lines:
-                    if line.startswith('• '):
-                        original = line[2:].trip()
-                        corrected = auto_correct_text(original, spell, "job title")
-                        corrected_lines.append(f"• {corrected}")
-                    else:
-                        corrected_lines.append(line)
-                context[field] = '\n'.join(corrected_lines)
-    
+    check_fields = [('nzemployers', 'employer name'),
+                    ('internationalemployers', 'employer name'),
+                    ('nzpositions', 'job title'),
+                    ('internationalpositions', 'job title')]
+
+    # Work out which fields actually need checking, then make a single
+    # known() call over the union of their tokens; the per-field
+    # auto_correct_text calls reuse that result instead of crossing the
+    # pyspellchecker boundary once per field
+    pending = []
+    candidates = set()
+    for field, word_type in check_fields:
+        value = context.get(field)
+        if not isinstance(value, str) or value == "None":
+            continue
+        # Acronym/number-only fields have nothing correctable
+        if not any(c.islower() for c in value):
+            continue
+        pending.append((field, word_type, value))
+        candidates.update(w.lower() for w in _TOKEN_RE.findall(value)
+                          if len(w) > 2 and w.isalpha() and not w.isupper())
+
+    known = spell.known(candidates) if candidates else set()
+
+    for field, word_type, value in pending:
+        logging.info(f"Checking {word_type}s in {field}:")
+        corrected_lines = []
+        for line in value.split('\n'):
+            if line[:2] == '• ':
+                original = line[2:].strip()
+                corrected = auto_correct_text(original, spell, word_type,
+                                              known_words=known)
+                corrected_lines.append(f"• {corrected}")
+            else:
+                corrected_lines.append(line)
+        context[field] = '\n'.join(corrected_lines)
+
     logging.info("Spell check complete")
     return context
 
+# Words that should remain lowercase in position titles (unless at start)
+_POSITION_LOWERCASE = frozenset(map(sys.intern, {
+    'a', 'an', 'and', 'as', 'at', 'but', 'by', 'for', 'in',
+    'of', 'on', 'or', 'the', 'to', 'with'
+}))
+
+@functools.lru_cache(maxsize=1024)
+def _cap_hyphenated(word: str) -> str:
+    """Capitalize a word part-by-part ("fitter-turner" -> "Fitter-Turner")."""
+    if '-' in word:
+        return '-'.join(part.capitalize() for part in word.split('-'))
+    return word.capitalize()
+
+# Shared by name and position formatting; the same names and professions
+# recur across CVs, so memoize the whole transformation
+@functools.lru_cache(maxsize=2048)
+def _format_title(text: str, lowercase_words: frozenset = frozenset()) -> str:
+    """Capitalize each word hyphen-aware, keeping stopwords lowercase
+    except at the start."""
+    formatted_words = []
+    for i, word in enumerate(text.split()):
+        if i:
+            word_lower = word if word.islower() else word.lower()
+            if word_lower in lowercase_words:
+                formatted_words.append(word_lower)
+                continue
+        formatted_words.append(_cap_hyphenated(word))
+    return ' '.join(formatted_words)
+
+# Undoes str.title() capitalizing possessive suffixes ("Smith'S" -> "Smith's")
+_APOS_FIX_RE = re.compile(r"'([A-Z])\b")
+
 def format_name(name_str: str) -> str:
     """
     Format name strings with proper capitalization.
@@ -182,21 +351,27 @@ def format_name(name_str: str) -> str:
     """
     if not name_str:
         return ""
-        
-    # Split the string into words and capitalize each word
-    words = name_str.split()
-    formatted_words = []
-    
-    for word in words:
-        # Handle hyphenated words
-        if '-' in word:
-            formatted_word = '-'.join(part.capitalize() for part in word.split('-'))
-            formatted_words.append(formatted_word)
-        else:
-            formatted_words.append(word.capitalize())
-            
-    return ' '.join(formatted_words)
 
+    # str.title() capitalizes every word and hyphen segment in one C call.
+    # Its only miss on names is uppercasing a lone trailing letter after an
+    # apostrophe ("Smith'S"); the regex undoes that while leaving
+    # "O'Brien"-style names alone.
+    return _APOS_FIX_RE.sub(lambda m: "'" + m.group(1).lower(),
+                            name_str.title())
+
+# Shared LocationService: the constructor reads and parses nz_locations.json,
+# so build it once per process instead of per address lookup
+_LOCATION_SERVICE = None
+
+def _get_location_service() -> LocationService:
+    """Return the shared LocationService, creating it on first use."""
+    global _LOCATION_SERVICE
+    if _LOCATION_SERVICE is None:
+        _LOCATION_SERVICE = LocationService()
+    return _LOCATION_SERVICE
+
+# Addresses repeat heavily across experience entries, so memoize the lookup
+@functools.lru_cache(maxsize=1024)
 def extract_city_from_address(address: str) -> str:
     """
     Extract location from an address string by checking against nz_locations.json.
@@ -205,29 +380,36 @@ def extract_city_from_address(address: str) -> str:
     """
     if not address:
         return ""
-        
+
     # Convert to lowercase for matching
     address_lower = address.lower()
-    
-    # Initialize LocationService
-    location_service = LocationService()
-    
-    # Check if any part of the address matches a known NZ location
-    if location_service.is_nz_location(address_lower):
-        # Find which part matched
-        for nz_loc in location_service.nz_locations:
-            if nz_loc in address_lower:
-                return nz_loc.title()
-    
+
+    location_service = _get_location_service()
+
+    # Single pass over the address instead of scanning every known location
+    nz_loc = location_service.find_nz_location(address_lower)
+    if nz_loc:
+        return nz_loc.title()
+
     # If no match found in nz_locations.json, return the original address
     return address
 
+# Data files live alongside this module, never at a machine-specific path
+_DATA_DIR = Path(__file__).parent / 'data'
+
+# Dot removal via translate, guarded so dot-free words (the vast majority)
+# are returned as-is without allocating a copy
+_NO_DOTS = str.maketrans('', '', '.')
+
+def _strip_dots(s: str) -> str:
+    return s.translate(_NO_DOTS) if '.' in s else s
+
 def load_company_suffixes():
     """Load company suffixes from company_status.json file."""
     try:
-        with open('/Users/claytonbadland/flask_project/data/company_status.json', 'r') as f:
-            data = json.load(f)
-            
+        with open(_DATA_DIR / 'company_status.json', 'rb') as f:
+            data = orjson.loads(f.read()) if orjson is not None else json.load(f)
+
         # Create a mapping of lowercase variations to preferred format
         suffixes = {}
         
@@ -235,7 +417,7 @@ def load_company_suffixes():
         for key, _ in data.items():
             if key != 'status_words':
                 # Remove dots and convert to lowercase for matching
-                clean_key = key.replace('.', '').lower()
+                clean_key = _strip_dots(key).lower()
                 # Use the most formal version (typically the one starting with uppercase)
                 if clean_key in suffixes:
                     if key[0].isupper():
@@ -265,8 +447,24 @@ def load_company_suffixes():
             'w.i.i': 'W.I.I', 'l.l.c': 'LLC', 'p.l.c': 'PLC'
         }
 
-# Cache for company suffixes
-_COMPANY_SUFFIXES = None
+# Company suffixes, loaded once at import so every worker pays the JSON
+# parse exactly once; interned keys make the dict lookups in format_part
+# hit the identity-compare fast path
+_COMPANY_SUFFIXES = {sys.intern(k): v for k, v in load_company_suffixes().items()}
+
+def _build_suffix_trie(suffixes):
+    """Tokenize suffix keys (dotted and dot-free variants) into a nested-dict
+    trie; a None key marks a terminal node and stores the mapped value."""
+    trie = {}
+    for key, value in suffixes.items():
+        for variant in {key, _strip_dots(key)}:
+            node = trie
+            for token in variant.split():
+                node = node.setdefault(token, {})
+            node[None] = value
+    return trie
+
+_SUFFIX_TRIE = _build_suffix_trie(_COMPANY_SUFFIXES)
 
 # Global cache for short words
 _SHORT_WORDS = None
@@ -274,8 +472,10 @@ _SHORT_WORDS = None
 def load_short_words():
     """Load short words from short_words.json file."""
     try:
-        with open('/Users/claytonbadland/flask_project/data/short_words.json', 'r') as f:
-            words = set(json.load(f))
+        with open(_DATA_DIR / 'short_words.json', 'rb') as f:
+            # Stored lowercased so membership checks need no per-entry lower()
+            data = orjson.loads(f.read()) if orjson is not None else json.load(f)
+            words = {w.lower() for w in data}
             # Explicitly add country prefixes to ensure they're properly handled
             words.add("new")  # For "New Zealand", "New South Wales", etc.
             return words
@@ -286,6 +486,46 @@ def load_short_words():
 # Load short words during initialization
 _SHORT_WORDS = load_short_words()
 
+# Constant word sets for format_company_name, built once instead of per call
+
+# Common words that should be lowercase unless at start
+_COMMON_WORDS = frozenset({
+    'and', 'of', 'the', 'in', 'on', 'at', 'to', 'for', 'with', 'by',
+    'de', 'van', 'der', 'den', 'von', 'und', 'les', 'la', 'el'
+})
+
+# Common business acronyms to preserve; interned so the per-word membership
+# tests in is_acronym hit the identity-compare fast path
+_KNOWN_ACRONYMS = frozenset(map(sys.intern, {
+    'AE', 'IBM', 'ANZ', 'BNZ', 'MSS', 'LLC', 'LTD', 'INC', 'PTY',
+    'GmbH', 'AG', 'NV', 'SA', 'PLC', 'CO', 'W.I.I', 'UAE', 'KSA'
+}))
+
+# Common last name words that should never be treated as acronyms
+_COMMON_LAST_NAMES = frozenset(map(sys.intern, {
+    'SMITH', 'JONES', 'BROWN', 'WILSON', 'TAYLOR', 'JOHNSON',
+    'WHITE', 'MARTIN', 'ANDERSON', 'THOMPSON', 'WOOD'
+}))
+
+# Terms that should NOT be treated as acronyms despite being uppercase
+_NOT_ACRONYMS = frozenset(map(sys.intern, {
+    'CONT', 'SITE', 'GULF', 'GENERAL', 'EAST', 'WEST', 'NORTH', 'SOUTH'
+}))
+
+# Special case handling for country names
+_COUNTRY_NAMES = {
+    "NEW ZEALAND": "New Zealand",
+    "UAE": "UAE",
+    "USA": "USA",
+    "UK": "UK",
+    "KSA": "KSA"
+}
+
+# The formatter is pure over its input and the same company recurs within a
+# CV (context plus bullet lists) and across a batch, so cache results. This
+# relies on _COMPANY_SUFFIXES / _SUFFIX_TRIE / _SHORT_WORDS being immutable
+# after module load; sized for batch runs touching many distinct employers.
+@functools.lru_cache(maxsize=8192)
 def format_company_name(name: str) -> str:
     """
     Format company names with special handling for acronyms, parentheses, and company suffixes.
@@ -294,21 +534,10 @@ def format_company_name(name: str) -> str:
     """
     if not name:
         return ""
-    
-    # Load company suffixes if not already loaded
-    global _COMPANY_SUFFIXES
-    if _COMPANY_SUFFIXES is None:
-        _COMPANY_SUFFIXES = load_company_suffixes()
-    
+
     # Ensure KSA is properly capitalized (explicitly handle this case)
     name = name.replace('(ksa)', '(KSA)').replace('(Ksa)', '(KSA)')
-    
-    # Common words that should be lowercase unless at start
-    common_words = {
-        'and', 'of', 'the', 'in', 'on', 'at', 'to', 'for', 'with', 'by',
-        'de', 'van', 'der', 'den', 'von', 'und', 'les', 'la', 'el'
-    }
-    
+
     # Preserve periods in company names like "Co."
     has_period = name.endswith(".")
     
@@ -328,48 +557,28 @@ def format_company_name(name: str) -> str:
         3. Words with dots between letters are acronyms
         4. Common last name words are never acronyms
         """
-        # Remove dots and check if it's all uppercase
-        clean_word = word.replace('.', '')
-        
-        # Common business acronyms to preserve
-        known_acronyms = {
-            'AE', 'IBM', 'ANZ', 'BNZ', 'MSS', 'LLC', 'LTD', 'INC', 'PTY',
-            'GmbH', 'AG', 'NV', 'SA', 'PLC', 'CO', 'W.I.I', 'UAE', 'KSA'
-        }
-        
-        # Common last name words that should never be treated as acronyms
-        common_last_names = {
-            'SMITH', 'JONES', 'BROWN', 'WILSON', 'TAYLOR', 'JOHNSON',
-            'WHITE', 'MARTIN', 'ANDERSON', 'THOMPSON', 'WOOD'
-        }
-        
-        # Terms that should NOT be treated as acronyms despite being uppercase
-        not_acronyms = {
-            'CONT', 'SITE', 'GULF', 'GENERAL', 'EAST', 'WEST', 'NORTH', 'SOUTH'
-        }
-        
-        # If it's in the not_acronyms list, it's definitely not an acronym
-        if clean_word.upper() in not_acronyms:
+        # Remove dots only when there are any; most words allocate nothing
+        clean_word = _strip_dots(word)
+
+        # If it's in the not-acronyms list, it's definitely not an acronym
+        if clean_word.upper() in _NOT_ACRONYMS:
             return False
-        
+
         # If it's a known acronym, preserve it
-        if clean_word in known_acronyms:
+        if clean_word in _KNOWN_ACRONYMS:
             return True
-        
+
         # If it's a common last name, it's not an acronym
-        if clean_word in common_last_names:
+        if clean_word in _COMMON_LAST_NAMES:
             return False
-        
+
         # Check for dots between letters (like W.I.I)
         if '.' in word and all(c.isupper() or c == '.' for c in word):
             return True
-        
-        # For 2-3 letter words, they must be known acronyms to be preserved
-        if len(clean_word) <= 3:
-            return clean_word in known_acronyms
-        
-        # For longer words, they must be in known_acronyms to be considered acronyms
-        return clean_word in known_acronyms
+
+        # Everything else must be a known acronym to be preserved; the word
+        # was already checked against _KNOWN_ACRONYMS above, so it isn't one
+        return False
     
     def format_part(text: str, is_in_parentheses: bool = False) -> str:
         if not text:
@@ -380,29 +589,26 @@ def format_company_name(name: str) -> str:
         words = [w for w in text.split() if w]
         formatted_words = []
         
-        # Special case handling for country names
-        country_names = {
-            "NEW ZEALAND": "New Zealand",
-            "UAE": "UAE",
-            "USA": "USA",
-            "UK": "UK",
-            "KSA": "KSA"
-        }
-        
         # Check for country names in the text
-        for country, proper_format in country_names.items():
+        for country, proper_format in _COUNTRY_NAMES.items():
             for i in range(len(words) - len(country.split()) + 1):
                 potential_country = " ".join(w.upper() for w in words[i:i+len(country.split())])
                 if potential_country == country:
                     for j, proper_word in enumerate(proper_format.split()):
                         words[i+j] = proper_word
         
+        # Lowercase every token once, after the country-name normalization
+        # above has finished rewriting words in place
+        words_lower = [w.lower() for w in words]
+
+        # Local binding so the per-word loop loads it as a fast local
+        suffix_trie = _SUFFIX_TRIE
+
         i = 0
         while i < len(words):
             word = words[i]
-            word_lower = word.lower()
-            word_no_dots = word_lower.replace('.', '')
-            
+            word_lower = words_lower[i]
+
             # Special case for "the" at the beginning (should be "The", not "THE")
             if i == 0 and word_lower == "the":
                 formatted_words.append("The")
@@ -416,7 +622,7 @@ def format_company_name(name: str) -> str:
                 # Get the next word and capitalize it regardless of other rules
                 next_word = words[i]
                 # Special case for country acronyms after hyphen
-                if next_word.lower() == "ksa":
+                if words_lower[i] == "ksa":
                     formatted_words.append("KSA")
                 # Special handling for known acronyms after hyphen
                 elif is_acronym(next_word):
@@ -457,28 +663,35 @@ def format_company_name(name: str) -> str:
                 i += 1
                 continue
             
-            # Check for multi-word company suffixes (like "W.I.I")
-            found_suffix = False
-            for j in range(min(3, len(words) - i), 0, -1):
-                potential_suffix = ' '.join(words[i:i+j]).lower()
-                potential_suffix_no_dots = potential_suffix.replace('.', '')
-                if potential_suffix in _COMPANY_SUFFIXES or potential_suffix_no_dots in _COMPANY_SUFFIXES:
-                    suffix_key = potential_suffix if potential_suffix in _COMPANY_SUFFIXES else potential_suffix_no_dots
-                    formatted_words.append(_COMPANY_SUFFIXES[suffix_key])
-                    i += j
-                    found_suffix = True
+            # Check for multi-word company suffixes (like "W.I.I") with one
+            # trie descent instead of joining/lowercasing j=3,2,1 windows
+            node = suffix_trie
+            match_value = None
+            match_len = 0
+            for j in range(min(3, len(words) - i)):
+                token = words_lower[i + j]
+                nxt = node.get(token)
+                if nxt is None and '.' in token:
+                    nxt = node.get(token.translate(_NO_DOTS))
+                if nxt is None:
                     break
-            
-            if found_suffix:
+                node = nxt
+                if None in node:
+                    match_value = node[None]
+                    match_len = j + 1
+
+            if match_len:
+                formatted_words.append(match_value)
+                i += match_len
                 continue
-                
+
             # Handle words of 3 letters or less
             if len(word) <= 3:
                 if word_lower in {"new", "abu", "hong"}:  # Direct check for geographic prefixes
                     # Check if this might be part of a geographic name
-                    if i + 1 < len(words) and words[i+1].lower() in {"zealand", "york", "south", "delhi", "kong", "dhabi"}:
+                    if i + 1 < len(words) and words_lower[i+1] in {"zealand", "york", "south", "delhi", "kong", "dhabi"}:
                         formatted_words.append(word.capitalize())
-                elif any(word_lower == w.lower() for w in _SHORT_WORDS):  # Normalize case for comparison
+                elif word_lower in _SHORT_WORDS:  # Set is pre-lowercased
                     formatted_words.append(word)  # Preserve original capitalization
                 else:
                     formatted_words.append(word.upper())  # Capitalize entirely
@@ -486,7 +699,7 @@ def format_company_name(name: str) -> str:
             elif is_acronym(word):
                 formatted_words.append(word)
             # Handle common words (lowercase unless at start)
-            elif word_lower in common_words and formatted_words:
+            elif word_lower in _COMMON_WORDS and formatted_words:
                 formatted_words.append(word_lower)
             # Regular capitalization for other words
             else:
@@ -502,38 +715,18 @@ def format_company_name(name: str) -> str:
     
     # Ensure proper spacing around parentheses
     name = name.replace('(', ' (').replace(')', ') ')
-    
-    # Split the name into parts based on parentheses
-    parts = []
-    current = []
-    in_parentheses = False
-    
-    for char in name:
-        if char == '(':
-            if current:
-                parts.append(''.join(current).strip())
-                current = []
-            in_parentheses = True
-            current.append('(')  # Keep parentheses without extra spaces
-        elif char == ')':
-            if current:
-                parts.append(''.join(current).strip())
-                current = []
-            in_parentheses = False
-            current.append(')')
-        else:
-            current.append(char)
-    
-    if current:
-        parts.append(''.join(current).strip())
-    
+
+    # Split the name into alternating outside/parenthesised parts in a
+    # single C-level scan instead of iterating character by character
+    parts = [p for part in _PAREN_RE.split(name) if (p := part.strip())]
+
     # Format each part
     formatted_parts = []
     for part in parts:
         if part.startswith('(') and part.endswith(')'):
-            # Format content inside parentheses and remove spaces
-            inner_content = part[1:-1].strip().replace(' ', '')
-            formatted_inner = format_part(inner_content, True)
+            # Format content inside parentheses word-wise; "(New Zealand)"
+            # keeps its space, "(ksa)" still becomes "(KSA)"
+            formatted_inner = format_part(part[1:-1].strip(), True)
             formatted_parts.append(f"({formatted_inner})")
         else:
             formatted_parts.append(format_part(part))
@@ -554,13 +747,14 @@ def format_company_name(name: str) -> str:
     return formatted_name
 
 def format_bullet_list(items: set) -> str:
-    """Format a set of items as a bullet-pointed list without leading newline."""
+    """Format a set of already-formatted items as a bullet-pointed list
+    without leading newline."""
     if not items:
         return 'None'
-    
-    # Sort items after formatting company names
-    formatted_items = sorted(format_company_name(item) for item in items)
-    
+
+    # Items were formatted during bucketing, so only sorting remains
+    formatted_items = sorted(items)
+
     # Join items with bullet points
     bullet_list = "• " + "\n• ".join(formatted_items)
     
@@ -585,6 +779,36 @@ def round_up_years(months: int) -> int:
     """
     return (months + 11) // 12
 
+class _ExperienceRow(NamedTuple):
+    """Flattened experience entry; tuple memory layout, named field access."""
+    is_nz: bool
+    company: str
+    title: str
+    months: int
+
+def _parse_months(value, company: str = '') -> int:
+    """Coerce a duration_in_months value to an int, defaulting to 0."""
+    if value is None:
+        logging.warning(f"No duration_in_months for {company}, defaulting to 0")
+        return 0
+    if isinstance(value, int):
+        return value
+    if isinstance(value, str):
+        try:
+            return int(value)
+        except ValueError as e:
+            logging.error(f"Could not parse duration for {company}: {e}")
+            return 0
+    logging.warning(f"Invalid duration_in_months type for {company}: {type(value)}")
+    return 0
+
+# Parsing a template is a zip + XML parse; cache it per (path, mtime) so a
+# batch of CVs against the same template pays the parse once. render()
+# mutates the template, so callers must deepcopy the cached instance.
+@functools.lru_cache(maxsize=8)
+def _load_template(path: str, mtime: float) -> DocxTemplate:
+    return DocxTemplate(path)
+
 class DocGenerator:
     """Document generator for CV documents."""
     
@@ -599,9 +823,9 @@ class DocGenerator:
         if not os.path.exists(template_path):
             raise FileNotFoundError(f"Template file not found at: {template_path}")
         self.template_path = template_path
-        self.location_service = LocationService()
+        self.location_service = _get_location_service()
         self.enable_spell_check = enable_spell_check
-        self.spell = initialize_spell_checker() if enable_spell_check else None
+        self.spell = get_spell_checker() if enable_spell_check else None
 
     def prepare_context(self, cv_data: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -615,38 +839,8 @@ class DocGenerator:
         context['name'] = format_name(f"{basics.get('first_name', '')} {basics.get('last_name', '')}")
         
         # Format position with proper capitalization
-        raw_position = basics.get('profession', '')
-        words = raw_position.split()
-        formatted_words = []
-        
-        # Words that should remain lowercase (unless at start)
-        lowercase_words = {
-            'a', 'an', 'and', 'as', 'at', 'but', 'by', 'for', 'in',
-            'of', 'on', 'or', 'the', 'to', 'with'
-        }
-        
-        # Format each word
-        for i, word in enumerate(words):
-            # First word is always capitalized
-            if i == 0:
-                if '-' in word:
-                    formatted_word = '-'.join(part.capitalize() for part in word.split('-'))
-                    formatted_words.append(formatted_word)
-                else:
-                    formatted_words.append(word.capitalize())
-            # Handle subsequent words
-            else:
-                # Check if word should be lowercase
-                if word.lower() in lowercase_words:
-                    formatted_words.append(word.lower())
-                # Handle hyphenated words
-                elif '-' in word:
-                    formatted_word = '-'.join(part.capitalize() for part in word.split('-'))
-                    formatted_words.append(formatted_word)
-                else:
-                    formatted_words.append(word.capitalize())
-        
-        context['position'] = ' '.join(formatted_words)
+        context['position'] = _format_title(basics.get('profession', ''),
+                                            _POSITION_LOWERCASE)
         
         # Get blurb directly from profile, not from basics
         blurb = profile.get('blurb', '')
@@ -663,67 +857,40 @@ class DocGenerator:
         
         # Professional Experience - Split into NZ and International using is_nz flag
         experiences = profile.get('professional_experiences', [])
-        nz_experiences = []
-        international_experiences = []
-        nz_months = 0
-        international_months = 0
-        total_months = 0
-        
-        # Lists to collect unique employers and positions
-        nz_employers = set()
-        international_employers = set()
-        nz_positions = set()
-        international_positions = set()
-        
+
         logging.info("Experience duration debug")
-        
-        # Process each experience entry
-        for exp in experiences:
-            company_name = format_company_name(exp.get('company', ''))
-            formatted_exp = {
-                'company': company_name,
-                'position': exp.get('title', ''),  # Use title consistently
-                'start_date': exp.get('start_date', ''),
-                'end_date': exp.get('end_date', 'Present'),
-                'description': exp.get('description', ''),
-                'highlights': exp.get('highlights', []),
-                'location': exp.get('location', '')
-            }
-            
-            # Get duration in months from JSON with better error handling
-            try:
-                duration_months = exp.get('duration_in_months')
-                if duration_months is None:
-                    logging.warning(f"No duration_in_months for {formatted_exp['company']}, defaulting to 0")
-                    duration_months = 0
-                elif isinstance(duration_months, str):
-                    duration_months = int(duration_months)
-                elif not isinstance(duration_months, int):
-                    logging.warning(f"Invalid duration_in_months type for {formatted_exp['company']}: {type(duration_months)}")
-                    duration_months = 0
-            except (ValueError, TypeError) as e:
-                logging.error(f"Could not parse duration for {formatted_exp['company']}: {e}")
-                duration_months = 0
-                    
-            logging.info(f"Experience at {formatted_exp['company']}: {duration_months} months")
-            
-            # Add duration to appropriate category based on is_nz flag
-            if exp.get('is_nz', False):
-                nz_months += duration_months
-                nz_experiences.append(formatted_exp)
-                if formatted_exp['company']:
-                    nz_employers.add(formatted_exp['company'])
-                if formatted_exp['position']:
-                    nz_positions.add(formatted_exp['position'])
-            else:
-                international_months += duration_months
-                international_experiences.append(formatted_exp)
-                if formatted_exp['company']:
-                    international_employers.add(formatted_exp['company'])
-                if formatted_exp['position']:
-                    international_positions.add(formatted_exp['position'])
-            
-            total_months += duration_months
+
+        # Flatten each experience once to (is_nz, company, title, months),
+        # then partition with comprehensions instead of branching through
+        # repeated dict lookups per entry
+        # Titles go through format_company_name here rather than in
+        # format_bullet_list, so each unique string is formatted once and
+        # the buckets dedupe on the formatted form. Local bindings keep the
+        # per-entry callable lookups out of the global namespace.
+        fmt_co = format_company_name
+        parse_months = _parse_months
+        rows = [_ExperienceRow(
+                    bool(exp.get('is_nz')),
+                    fmt_co(exp.get('company', '')),
+                    fmt_co(exp.get('title', '')),  # Use title consistently
+                    parse_months(exp.get('duration_in_months'), exp.get('company', '')))
+                for exp in experiences]
+
+        for row in rows:
+            logging.info(f"Experience at {row.company}: {row.months} months")
+
+        nz_rows = [r for r in rows if r.is_nz]
+        international_rows = [r for r in rows if not r.is_nz]
+
+        nz_months = sum(r.months for r in nz_rows)
+        international_months = sum(r.months for r in international_rows)
+        total_months = nz_months + international_months
+
+        # Unique employers and positions per bucket
+        nz_employers = {r.company for r in nz_rows if r.company}
+        international_employers = {r.company for r in international_rows if r.company}
+        nz_positions = {r.title for r in nz_rows if r.title}
+        international_positions = {r.title for r in international_rows if r.title}
         
         # Convert months to years (rounded up)
         total_years = round_up_years(total_months)
@@ -744,14 +911,28 @@ class DocGenerator:
         
         # Update the JSON structure with calculated years
         if 'data' in cv_data:
-            cv_data['data']['profile']['basics']['total_experience_in_years'] = total_years
+            basics_ref = cv_data['data']['profile']['basics']
         else:
-            cv_data['profile']['basics']['total_experience_in_years'] = total_years
-            
-        # Save the updated JSON back to file
-        json_path = os.path.join('parsed_jsons', f"{Path(self.template_path).stem}_enriched.json")
-        with open(json_path, 'w', encoding='utf-8') as f:
-            json.dump(cv_data, f, indent=4)
+            basics_ref = cv_data['profile']['basics']
+
+        # Persist only when the computed value actually changed; rewriting
+        # the whole pretty-printed CV to store an unchanged int is the
+        # expensive common case on regeneration
+        if basics_ref.get('total_experience_in_years') != total_years:
+            basics_ref['total_experience_in_years'] = total_years
+
+            # Save the updated JSON back to file; orjson writes UTF-8 bytes
+            # directly, and the tmp + os.replace keeps the file whole if the
+            # process dies mid-write
+            json_path = os.path.join('parsed_jsons', f"{Path(self.template_path).stem}_enriched.json")
+            tmp_path = f"{json_path}.tmp"
+            if orjson is not None:
+                with open(tmp_path, 'wb') as f:
+                    f.write(orjson.dumps(cv_data, option=orjson.OPT_INDENT_2))
+            else:
+                with open(tmp_path, 'w', encoding='utf-8') as f:
+                    json.dump(cv_data, f, indent=4)
+            os.replace(tmp_path, json_path)
         
         # Format years of experience as sentences
         context['nzyears'] = format_years_experience(nz_years, "New Zealand")
@@ -818,8 +999,8 @@ class DocGenerator:
             # 2. JSON Data Loading
             logging.info(f"JSON path: {json_path}")
             logging.info(f"JSON exists: {os.path.exists(json_path)}")
-            with open(json_path, 'r', encoding='utf-8') as f:
-                cv_data = json.load(f)
+            with open(json_path, 'rb') as f:
+                cv_data = orjson.loads(f.read()) if orjson is not None else json.load(f)
             logging.info("JSON data loaded successfully")
             
             # 3. Context Preparation
@@ -864,7 +1045,10 @@ class DocGenerator:
             # 4. Template Loading
             logging.info("Template loading")
             try:
-                doc = DocxTemplate(self.template_path)
+                # Deepcopy of the cached parse is much cheaper than
+                # re-reading and re-parsing the .docx zip
+                doc = copy.deepcopy(_load_template(
+                    self.template_path, os.path.getmtime(self.template_path)))
                 logging.info("Template loaded successfully")
                 
                 # Safety check before accessing docx attributes - prevents AttributeError
@@ -911,36 +1095,29 @@ class DocGenerator:
                 doc.render(context)
                 logging.info("Template rendering completed")
                 
-                # Generate only one output file
-                base_name = Path(json_path).stem
-                if (base_name.endswith('_enriched')):
-                    base_name = base_name[:-9]
-                
-                # Sanitize the base name
-                sanitized_base_name = sanitize_filename(base_name)
+                # Generate only one output file, at the memoized canonical path
+                output_path = _output_path_for(json_path)
                 
-                # Use the sanitized name for the output path
-                output_path = os.path.join(OUTPUTS_DIR, f"{sanitized_base_name}_CV.docx")
-                
-                # Save document
+                # Save into memory first: the empty-output check runs before
+                # anything touches disk, and the file lands in one buffered
+                # write instead of save + exists + getsize round trips
                 logging.info(f"Saving document to: {output_path}")
-                doc.save(output_path)
-                
-                # Verify output
-                if os.path.exists(output_path):
-                    output_size = os.path.getsize(output_path)
-                    logging.info(f"Output file created successfully. Size: {output_size} bytes")
-                    if output_size == 0:
-                        raise ValueError("Generated file is empty")
-                    
-                    # Track the file creation
-                    from file_tracker import track_file
-                    track_file(output_path, "generate", "created", "Final document generated")
-                    
-                    logging.info("Document generated successfully")
-                    return output_path
-                else:
-                    raise FileNotFoundError("Output file was not created")
+                buf = io.BytesIO()
+                doc.save(buf)
+                data = buf.getbuffer()
+                output_size = len(data)
+                if output_size == 0:
+                    raise ValueError("Generated file is empty")
+
+                with open(output_path, 'wb', buffering=65536) as f:
+                    f.write(data)
+                logging.info(f"Output file created successfully. Size: {output_size} bytes")
+
+                # Track the file creation
+                track_file(output_path, "generate", "created", "Final document generated")
+
+                logging.info("Document generated successfully")
+                return output_path
                 
             except Exception as render_error:
                 logging.error(f"Document generation error: {render_error}")
@@ -964,8 +1141,66 @@ def generate_cv_document(json_path: str, template_path: str, projects_data: Opti
     Returns:
         str: Path to the generated CV document
     """
-    generator = DocGenerator(template_path, enable_spell_check=enable_spell_check)
-    return generator.generate_cv_document(json_path, projects_data)
+    return _get_generator(template_path, enable_spell_check).generate_cv_document(
+        json_path, projects_data)
+
+@functools.lru_cache(maxsize=8)
+def _get_generator(template_path: str, enable_spell_check: bool) -> DocGenerator:
+    """One DocGenerator per (template, spell-check) combination.
+
+    The generator holds no per-document state, so repeat renders reuse it;
+    the template parse itself is cached separately by _load_template with
+    mtime invalidation."""
+    return DocGenerator(template_path, enable_spell_check=enable_spell_check)
+
+def generate_cv_documents(jobs, template_path: str,
+                          enable_spell_check: bool = ENABLE_SPELL_CHECK) -> list:
+    """
+    Generate several CV documents in this process with one DocGenerator.
+
+    The generator, parsed template, spell checker and formatting caches are
+    all built once and shared across the batch, so per-document cost is just
+    the JSON parse and render.
+
+    Args:
+        jobs: Iterable of (json_path, projects_data) tuples; projects_data
+            may be None
+        template_path: Path to the template file
+        enable_spell_check: Whether to enable spell checking
+
+    Returns:
+        list: Output paths in job order
+    """
+    generator = _get_generator(template_path, enable_spell_check)
+    return [generator.generate_cv_document(json_path, projects_data)
+            for json_path, projects_data in jobs]
+
+def _generate_cv_worker(job):
+    """Top-level worker for the process pool (must be picklable)."""
+    json_path, template_path = job
+    return generate_cv_document(json_path, template_path)
+
+def generate_cv_documents_batch(jobs, workers: Optional[int] = None) -> list:
+    """
+    Generate many CV documents in parallel across processes.
+
+    Rendering is CPU-bound (XML render, JSON parse, company formatting), so
+    a process pool scales with cores; the module-level caches (suffix trie,
+    spell checker, templates) warm up lazily in each worker on first use.
+
+    Args:
+        jobs: Iterable of (json_path, template_path) tuples
+        workers: Number of worker processes (default: CPU count)
+
+    Returns:
+        list: Output paths in job order
+    """
+    jobs = list(jobs)
+    if len(jobs) <= 1:
+        return [_generate_cv_worker(job) for job in jobs]
+
+    with ProcessPoolExecutor(max_workers=workers or os.cpu_count()) as executor:
+        return list(executor.map(_generate_cv_worker, jobs))
 
 def fix_slash_spacing(text: str) -> str:
     """
@@ -6,25 +6,39 @@ from pathlib import Path
 from typing import Optional, Dict, Any, Union
 from datetime import timedelta
 import tempfile
+import threading
 from retry_utils import retry_with_backoff
 
+# Single shared FirebaseConfig for the module-level wrapper functions, so
+# each call doesn't rebuild the firestore client and storage bucket handles
+_CONFIG_LOCK = threading.Lock()
+_SHARED_CONFIG = None
+
+def _get_config() -> "FirebaseConfig":
+    """Return the shared FirebaseConfig, creating it once under a lock."""
+    global _SHARED_CONFIG
+    if _SHARED_CONFIG is None:
+        with _CONFIG_LOCK:
+            if _SHARED_CONFIG is None:
+                _SHARED_CONFIG = FirebaseConfig()
+    return _SHARED_CONFIG
+
 @retry_with_backoff(max_retries=3, initial_delay=1, exceptions_to_check=(Exception,))
-def upload_file(file_path: Optional[str] = None, 
-                destination_blob_name: str = None, 
+def upload_file(file_path: Optional[str] = None,
+                destination_blob_name: str = None,
                 data: Optional[bytes] = None) -> Optional[str]:
     """
     Wrapper function to upload a file to Firebase Storage.
-    
+
     Args:
         file_path: Local path to the file to upload (ignored if data is provided)
         destination_blob_name: Name for the file in Firebase Storage
         data: Binary data to upload (takes precedence over file_path if provided)
-    
+
     Returns:
         str or None: A signed URL for the uploaded file, or None on failure
     """
-    firebase_config = FirebaseConfig()
-    return firebase_config.upload_file(file_path, destination_blob_name, data)
+    return _get_config().upload_file(file_path, destination_blob_name, data)
 
 class FirebaseConfig:
     """Configuration and utility methods for Firebase integration."""
@@ -183,8 +197,7 @@ def download_file_to_downloads(blob_name: str, local_filename: Optional[str] = N
     Returns:
         Path: Path to the downloaded file in Downloads folder, or None if failed
     """
-    firebase_config = FirebaseConfig()
-    return firebase_config.download_file_from_firebase(blob_name, local_filename)
+    return _get_config().download_file_from_firebase(blob_name, local_filename)
 
 
 def upload_json_to_firebase(json_data: Union[Dict, Any], destination_blob_name: str) -> Optional[str]:
@@ -217,8 +230,7 @@ def upload_json_to_firebase(json_data: Union[Dict, Any], destination_blob_name:
             destination_blob_name = f"{destination_folder}/{destination_blob_name}"
         
         # Upload the temporary file to Firebase
-        firebase_config = FirebaseConfig()
-        signed_url = firebase_config.upload_file(tmp_path, destination_blob_name)
+        signed_url = _get_config().upload_file(tmp_path, destination_blob_name)
         
         # Clean up the temporary file
         os.unlink(tmp_path)
@@ -246,8 +258,8 @@ def download_file(blob_name: str) -> Optional[bytes]:
         Optional[bytes]: The file contents as bytes, or None if download fails
     """
     try:
-        firebase_config = FirebaseConfig()
-        
+        firebase_config = _get_config()
+
         # Check if blob exists with this name first
         blob = firebase_config.bucket.blob(blob_name)
         if not blob.exists():
@@ -20,6 +20,20 @@ class LocationService:
             print(f"Error loading NZ locations: {e}")
             self.nz_locations = set()
 
+        # Combined pattern over all locations, built lazily; one C-level scan
+        # of the text replaces a per-location re.search loop
+        self._nz_pattern = None
+
+    def _nz_regex(self):
+        """Compile (once) a single alternation matching any NZ location."""
+        if self._nz_pattern is None and self.nz_locations:
+            # Longest first so e.g. "palmerston north" wins over "palmerston"
+            alternation = '|'.join(
+                re.escape(loc) for loc in
+                sorted(self.nz_locations, key=len, reverse=True))
+            self._nz_pattern = re.compile(r'\b(?:' + alternation + r')\b')
+        return self._nz_pattern
+
     def _clean_location(self, location: str) -> str:
         """Clean location string for comparison."""
         if not location:
@@ -27,28 +41,49 @@ class LocationService:
         # Remove common punctuation and convert to lowercase
         return location.lower().replace(',', ' ').replace('.', ' ').strip()
 
+    def _matches_nz(self, location_lower: str) -> bool:
+        """Check a cleaned location string against NZ locations with word boundaries."""
+        pattern = self._nz_regex()
+        return bool(pattern and pattern.search(location_lower))
+
+    def find_nz_location(self, text: str):
+        """
+        Return the first NZ location mentioned in the text (lowercase), or
+        None. Scans the text once regardless of how many locations are known.
+        """
+        if not text:
+            return None
+        pattern = self._nz_regex()
+        match = pattern.search(text.lower()) if pattern else None
+        return match.group(0) if match else None
+
     def is_nz_location(self, location_str: str) -> bool:
         """
         Determine if a location is in NZ using word boundary matching.
         """
         if not location_str:
             return False
-            
+
         # Optionally, you could clean the location string using _clean_location.
         location_lower = self._clean_location(location_str)
         print(f"DEBUG: Checking location: '{location_lower}'")
-        
-        # Check NZ locations with word boundaries
-        for nz_loc in self.nz_locations:
-            nz_loc_pattern = r'\b' + re.escape(nz_loc) + r'\b'
-            if re.search(nz_loc_pattern, location_lower):
-                print(f"Found NZ location {nz_loc} in location {location_lower}")
-                return True
+
+        if self._matches_nz(location_lower):
+            print(f"Found NZ location match in {location_lower}")
+            return True
 
         # Default to international if no matches found
         print(f"No location matches found for {location_lower}, defaulting to international")
         return False
 
+    def is_nz_location_many(self, location_strs) -> list:
+        """
+        Classify a batch of location strings in one call, normalizing each
+        input once and skipping the per-call debug output.
+        """
+        return [bool(s) and self._matches_nz(self._clean_location(s))
+                for s in location_strs]
+
     def enrich_experience_locations(self, parsed_json: dict) -> dict:
         """
         Enrich each job experience with a Boolean 'is_nz' flag.
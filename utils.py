@@ -1,3 +1,8 @@
+from functools import lru_cache
+
+# Deterministic in its input, so repeat base names (regenerations, retries)
+# come straight out of the cache
+@lru_cache(maxsize=4096)
 def sanitize_filename(filename: str) -> str:
     """
     Sanitize a filename by replacing hyphens with underscores.